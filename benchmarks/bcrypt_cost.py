@@ -0,0 +1,38 @@
+"""
+bcrypt 비용 보정/벤치마크
+
+비용(rounds)별 해시 시간과 코어당 초당 해시 수를 출력하고,
+목표 시간(--target-ms)을 넘지 않는 가장 높은 비용을 BCRYPT_ROUNDS 추천값으로 출력합니다.
+(배포할 서버에서 실행)
+
+실행 예:
+    python -m benchmarks.bcrypt_cost --target-ms 100 --min-rounds 8 --max-rounds 14
+"""
+import argparse
+import os
+
+from src.app.utils.security import BCRYPT_ROUNDS, calibrate_rounds, measure_hash_ms
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="bcrypt 비용 보정/벤치마크")
+    parser.add_argument("--target-ms", type=float, default=100.0, help="로그인 1회 해시 목표 시간 (ms)")
+    parser.add_argument("--min-rounds", type=int, default=8, help="측정할 최소 비용")
+    parser.add_argument("--max-rounds", type=int, default=14, help="측정할 최대 비용")
+    parser.add_argument("--repeat", type=int, default=3, help="비용별 측정 반복 횟수 (최솟값 사용)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    cores = os.cpu_count()
+
+    print(f"{'rounds':<8}{'ms/hash':>10}{'hash/s/core':>14}{f'hash/s x{cores}':>14}")
+    for rounds in range(args.min_rounds, args.max_rounds + 1):
+        ms = measure_hash_ms(rounds, args.repeat)
+        marker = "  <- 현재 설정" if rounds == BCRYPT_ROUNDS else ""
+        print(f"{rounds:<8}{ms:>10.1f}{1000 / ms:>14.1f}{1000 / ms * cores:>14.1f}{marker}")
+
+    rounds, ms = calibrate_rounds(args.target_ms, args.repeat)
+    print(f"\n목표 {args.target_ms:.0f}ms 이하 최대 비용: BCRYPT_ROUNDS={rounds} ({ms:.1f}ms)")
+
+if __name__ == "__main__":
+    main()
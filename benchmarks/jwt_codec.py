@@ -0,0 +1,58 @@
+"""
+JWT 인코드/디코드 마이크로벤치마크
+
+python-jose와 HS256 전용 코덱(src/app/utils/jwt_codec.py)의 초당 처리량을 비교합니다.
+(python-jose는 bench 개발 의존성)
+
+실행 예:
+    python -m benchmarks.jwt_codec --number 20000
+"""
+import argparse
+import time
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+from src.app.utils.auth import SECRET_KEY, jwt_codec
+
+CLAIMS = {"sub": "user1", "email": "user1@example.com", "user_id": 1}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="JWT 코덱 마이크로벤치마크")
+    parser.add_argument("--number", type=int, default=20_000, help="측정당 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (최고값 사용)")
+    return parser.parse_args()
+
+def ops_per_second(func, number: int, repeat: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+def main():
+    args = parse_args()
+    from jose import jwt
+
+    # 기존 구현과 동일한 방식 (datetime 만료 시간 + uuid4 jti)
+    def jose_encode():
+        claims = {**CLAIMS, "exp": datetime.utcnow() + timedelta(minutes=30), "jti": str(uuid.uuid4())}
+        return jwt.encode(claims, SECRET_KEY, algorithm="HS256")
+
+    def codec_encode():
+        claims = {**CLAIMS, "exp": int(time.time()) + 30 * 60, "jti": jwt_codec.new_jti()}
+        return jwt_codec.encode(claims)
+
+    token = codec_encode()
+
+    results = {
+        "jose encode": ops_per_second(jose_encode, args.number, args.repeat),
+        "codec encode": ops_per_second(codec_encode, args.number, args.repeat),
+        "jose decode": ops_per_second(lambda: jwt.decode(token, SECRET_KEY, algorithms=["HS256"]), args.number, args.repeat),
+        "codec decode": ops_per_second(lambda: jwt_codec.decode(token), args.number, args.repeat),
+    }
+
+    for name, ops in results.items():
+        print(f"{name:<14}{ops:>12,.0f} ops/s")
+    print(f"encode 배율: {results['codec encode'] / results['jose encode']:.1f}x")
+    print(f"decode 배율: {results['codec decode'] / results['jose decode']:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""
+인프로세스 부하 벤치마크
+
+src/main.py의 app을 ASGI 트랜스포트로 직접 호출하여 라우트별 처리량과
+p50/p95/p99 지연 시간을 측정하고 JSON 파일로 저장합니다.
+임시 SQLite DB와 fakeredis를 사용하므로 외부 서버가 필요 없습니다.
+
+실행 예:
+    python -m benchmarks.load_test --users 10000 --posts 100000 --requests 5000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+BENCH_PASSWORD = "benchmark-password"
+
+# 요청 종류별 가중치 (합이 100일 필요는 없음)
+# 기본 비율에 없는 요청: user_posts (작성자별 게시글 목록)
+DEFAULT_MIX = {
+    "login": 10,
+    "list": 10,
+    "get": 40,
+    "create": 15,
+    "update": 15,
+    "logout": 10,
+}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="API 라우트별 인프로세스 부하 벤치마크")
+    parser.add_argument("--users", type=int, default=10_000, help="미리 생성할 사용자 수")
+    parser.add_argument("--posts", type=int, default=100_000, help="미리 생성할 게시글 수")
+    parser.add_argument("--requests", type=int, default=5_000, help="측정할 전체 요청 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 가상 사용자 수")
+    parser.add_argument("--warmup", type=int, default=200, help="측정에서 제외할 워밍업 요청 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (재현성)")
+    parser.add_argument("--mix", type=str, default=None, help='요청 비율 JSON (예: \'{"get": 80, "list": 20}\')')
+    parser.add_argument("--output", type=str, default="bench_results.json", help="결과 JSON 파일 경로")
+    return parser.parse_args()
+
+"""
+앱 import 전에 임시 DB 경로를 지정하고, Redis 클라이언트를 fakeredis 커넥션 풀로 교체
+"""
+def prepare_environment(db_path: str):
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    import fakeredis
+    import redis
+
+    from src.app.core import redis_config
+
+    redis_config.redis_client.connection_pool = redis.ConnectionPool(
+        connection_class=fakeredis.FakeConnection,
+        server=fakeredis.FakeServer(),
+        decode_responses=True,
+    )
+
+"""
+executemany 기반 대량 insert로 사용자와 게시글 데이터 생성
+bcrypt는 비용이 크므로 해시 하나를 모든 사용자가 공유
+"""
+def seed_database(num_users: int, num_posts: int, rng: random.Random):
+    from sqlalchemy import func, insert, select, update
+
+    from src.app.core.migrations import migrate
+    from src.app.database import SessionLocal, engine
+    from src.app.models.post import Post
+    from src.app.models.user import User
+    from src.app.utils.security import get_password_hash
+
+    migrate(engine)
+
+    hashed_password = get_password_hash(BENCH_PASSWORD)
+    batch_size = 5_000
+
+    with SessionLocal() as db:
+        for start in range(0, num_users, batch_size):
+            db.execute(insert(User), [
+                {
+                    "email": f"user{i}@example.com",
+                    "username": f"user{i}",
+                    "password": hashed_password,
+                }
+                for i in range(start, min(start + batch_size, num_users))
+            ])
+
+        for start in range(0, num_posts, batch_size):
+            rows = []
+            for i in range(start, min(start + batch_size, num_posts)):
+                author = rng.randrange(num_users)
+                rows.append({
+                    "title": f"게시글 {i}",
+                    "author": f"user{author}",
+                    "content": "본문 " * rng.randint(10, 200),
+                    "author_id": author + 1,
+                })
+            db.execute(insert(Post), rows)
+
+        # 대량 insert는 서비스를 거치지 않으므로 작성자별 게시글 수를 한 번에 채움
+        db.execute(update(User).values(post_count=(
+            select(func.count(Post.id)).
+            where(Post.author_id == User.id).
+            scalar_subquery()
+        )))
+        db.commit()
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+"""
+가상 사용자 한 명: 로그인 후 가중치에 따라 요청을 반복 (로그아웃 후에는 다시 로그인)
+"""
+class VirtualUser:
+    def __init__(self, client, username: str, num_users: int, num_posts: int, rng: random.Random):
+        self.client = client
+        self.username = username
+        self.num_users = num_users
+        self.num_posts = num_posts
+        self.rng = rng
+        self.token = None
+        self.own_posts = []
+
+    @property
+    def headers(self):
+        return {"Authorization": f"Bearer {self.token}"}
+
+    async def login(self):
+        response = await self.client.post("/auth/login", json={
+            "username": self.username,
+            "password": BENCH_PASSWORD,
+        })
+        if response.status_code == 200:
+            self.token = response.json()["access_token"]
+        return "POST /auth/login", response
+
+    async def run(self, op: str):
+        # 인증이 필요한 요청 전에 토큰이 없으면 로그인부터 측정
+        if op == "login" or (op in ("create", "update", "logout") and self.token is None):
+            return await self.login()
+
+        if op == "list":
+            return "GET /posts/", await self.client.get("/posts/")
+
+        if op == "get":
+            post_id = self.rng.randint(1, self.num_posts)
+            return "GET /posts/{post_id}", await self.client.get(f"/posts/{post_id}")
+
+        if op == "user_posts":
+            user_id = self.rng.randint(1, self.num_users)
+            return "GET /users/{user_id}/posts", await self.client.get(f"/users/{user_id}/posts")
+
+        if op == "update" and self.own_posts:
+            post_id = self.rng.choice(self.own_posts)
+            response = await self.client.patch(
+                f"/posts/{post_id}",
+                json={"content": "수정된 본문 " * self.rng.randint(10, 100)},
+                headers=self.headers,
+            )
+            return "PATCH /posts/{post_id}", response
+
+        if op in ("create", "update"):
+            response = await self.client.post("/posts/", json={
+                "title": "벤치마크 게시글",
+                "author": self.username,
+                "content": "본문 " * self.rng.randint(10, 200),
+            }, headers=self.headers)
+            if response.status_code == 200:
+                self.own_posts.append(response.json()["id"])
+            return "POST /posts/", response
+
+        # logout
+        response = await self.client.post("/auth/logout", headers=self.headers)
+        self.token = None
+        return "POST /auth/logout", response
+
+async def run_load(args, rng: random.Random) -> dict:
+    import httpx
+
+    from src.main import app
+
+    mix = json.loads(args.mix) if args.mix else DEFAULT_MIX
+    ops, weights = list(mix), list(mix.values())
+
+    total = args.warmup + args.requests
+    schedule = rng.choices(ops, weights=weights, k=total)
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    cursor = 0
+    measure_start = None
+
+    # ASGITransport는 lifespan을 실행하지 않으므로 직접 실행
+    # (블랙리스트 사본, 조회수 반영, 스레드풀 크기, 사용자 필터 워밍 등 실제 서버와 같은 상태에서 측정)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            vusers = [
+                VirtualUser(client, f"user{rng.randrange(args.users)}", args.users, args.posts, random.Random(rng.random()))
+                for _ in range(args.concurrency)
+            ]
+
+            async def worker(vuser: VirtualUser):
+                nonlocal cursor, measure_start
+                while cursor < total:
+                    index = cursor
+                    cursor += 1
+                    if index == args.warmup:
+                        measure_start = time.perf_counter()
+
+                    start = time.perf_counter()
+                    route, response = await vuser.run(schedule[index])
+                    elapsed = time.perf_counter() - start
+
+                    if index < args.warmup:
+                        continue
+                    latencies[route].append(elapsed)
+                    if response.status_code >= 400:
+                        errors[route] += 1
+
+            await asyncio.gather(*(worker(vuser) for vuser in vusers))
+        measure_end = time.perf_counter()
+
+    wall_time = measure_end - (measure_start or measure_end)
+
+    routes = {}
+    for route, values in sorted(latencies.items()):
+        values.sort()
+        routes[route] = {
+            "count": len(values),
+            "errors": errors[route],
+            "throughput_rps": round(len(values) / wall_time, 2) if wall_time else 0.0,
+            "mean_ms": round(statistics.fmean(values) * 1000, 3),
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p95_ms": round(percentile(values, 95) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round(values[-1] * 1000, 3),
+        }
+
+    measured = sum(route["count"] for route in routes.values())
+    return {
+        "wall_time_s": round(wall_time, 3),
+        "total_requests": measured,
+        "throughput_rps": round(measured / wall_time, 2) if wall_time else 0.0,
+        "routes": routes,
+    }
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    # 접근 로그 출력이 측정을 방해하지 않도록 경고 이상만 출력
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare_environment(os.path.join(tmp_dir, "bench.db"))
+
+        seed_start = time.perf_counter()
+        seed_database(args.users, args.posts, rng)
+        print(f"시드 데이터 생성: 사용자 {args.users}명, 게시글 {args.posts}개 ({time.perf_counter() - seed_start:.1f}s)")
+
+        result = asyncio.run(run_load(args, rng))
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": vars(args),
+        **result,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"{'route':<26}{'count':>8}{'err':>6}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for route, stats in report["routes"].items():
+        print(
+            f"{route:<26}{stats['count']:>8}{stats['errors']:>6}{stats['throughput_rps']:>10}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        )
+    print(f"전체 {report['total_requests']}건, {report['throughput_rps']} req/s -> {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Redis Cluster 샤드 수별 토큰 처리량 벤치마크
+
+로컬에 redis-server 노드 N개를 클러스터 모드로 띄우고(redis-server, redis-cli 필요),
+REDIS_CLUSTER_NODES로 연결한 TokenService의 토큰 연산(refresh 저장/검증, 블랙리스트 추가/조회)
+초당 처리량을 샤드 수별로 측정합니다. 부하는 여러 프로세스에서 생성합니다.
+
+실행 예:
+    python -m benchmarks.redis_cluster --shards 1 3 6 --duration 10
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+BASE_PORT = 7100
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Redis Cluster 샤드 수별 토큰 처리량 벤치마크")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 3, 6], help="측정할 샤드(primary) 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="샤드 수별 측정 시간 (초)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="부하 생성 프로세스 수")
+    parser.add_argument("--users", type=int, default=10_000, help="토큰을 발급할 사용자 수")
+    return parser.parse_args()
+
+"""
+로컬 클러스터 노드 실행 후 슬롯 배정, 모든 노드가 cluster_state:ok가 될 때까지 대기
+"""
+def start_cluster(shards: int, directory: str) -> list[subprocess.Popen]:
+    ports = [BASE_PORT + i for i in range(shards)]
+    processes = []
+    for port in ports:
+        node_dir = os.path.join(directory, str(port))
+        os.makedirs(node_dir)
+        processes.append(subprocess.Popen(
+            [
+                "redis-server", "--port", str(port), "--cluster-enabled", "yes",
+                "--cluster-config-file", "nodes.conf", "--save", "", "--appendonly", "no",
+            ],
+            cwd=node_dir,
+            stdout=subprocess.DEVNULL,
+        ))
+
+    for port in ports:
+        wait_for(lambda: subprocess.run(["redis-cli", "-p", str(port), "ping"], capture_output=True).returncode == 0)
+
+    subprocess.run(
+        ["redis-cli", "--cluster", "create", *[f"127.0.0.1:{port}" for port in ports], "--cluster-replicas", "0", "--cluster-yes"],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    for port in ports:
+        wait_for(lambda: "cluster_state:ok" in subprocess.run(
+            ["redis-cli", "-p", str(port), "cluster", "info"], capture_output=True, text=True
+        ).stdout)
+    return processes
+
+def wait_for(condition, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise RuntimeError("Redis 클러스터 준비 시간 초과")
+        time.sleep(0.1)
+
+def stop_cluster(processes: list[subprocess.Popen]):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.wait()
+
+"""
+부하 생성 프로세스: 사용자별 토큰 연산을 반복하고 처리한 연산 수를 반환
+"""
+def run_worker(nodes: str, worker: int, users: int, duration: float) -> int:
+    os.environ["REDIS_CLUSTER_NODES"] = nodes
+    from src.app.services.token_service import TokenService
+    from src.app.utils.auth import create_refresh_token
+
+    operations = 0
+    user_id = worker
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        user_id = (user_id + 7919) % users
+        token = create_refresh_token({"sub": f"user{user_id}", "user_id": user_id})
+        TokenService.store_refresh_token(user_id, token)
+        TokenService.validate_refresh_token(user_id, token)
+        TokenService.blacklist_token(token, 60)
+        TokenService.is_token_blacklisted(token)
+        operations += 4
+    return operations
+
+def measure(shards: int, args) -> float:
+    directory = tempfile.mkdtemp(prefix="redis-cluster-")
+    processes = start_cluster(shards, directory)
+    try:
+        nodes = ",".join(f"127.0.0.1:{BASE_PORT + i}" for i in range(shards))
+        with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+            counts = pool.starmap(
+                run_worker, [(nodes, worker, args.users, args.duration) for worker in range(args.processes)]
+            )
+        return sum(counts) / args.duration
+    finally:
+        stop_cluster(processes)
+        shutil.rmtree(directory, ignore_errors=True)
+
+def main():
+    args = parse_args()
+    if not shutil.which("redis-server") or not shutil.which("redis-cli"):
+        raise SystemExit("redis-server, redis-cli가 PATH에 있어야 합니다.")
+
+    baseline = None
+    for shards in args.shards:
+        ops = measure(shards, args)
+        baseline = baseline or ops
+        print(f"shards={shards:<3}{ops:>12,.0f} ops/s  ({ops / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
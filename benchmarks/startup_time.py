@@ -0,0 +1,98 @@
+"""
+콜드 스타트 벤치마크
+
+새 프로세스에서 앱 import 시간과 lifespan 시작 시간을 반복 측정하고,
+-X importtime 결과로 누적 import 시간이 큰 모듈 목록을 JSON 파일로 저장합니다.
+
+실행 예:
+    python -m benchmarks.startup_time --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+# 새 프로세스에서 실행할 측정 코드 (결과를 JSON 한 줄로 출력)
+MEASURE_SCRIPT = """
+import asyncio, json, time
+start = time.perf_counter()
+from src.main import app
+import_seconds = time.perf_counter() - start
+
+async def run():
+    async with app.router.lifespan_context(app):
+        pass
+
+start = time.perf_counter()
+asyncio.run(run())
+startup_seconds = time.perf_counter() - start
+print(json.dumps({
+    "import_ms": import_seconds * 1000,
+    "startup_ms": startup_seconds * 1000,
+    "report": app.state.startup_report,
+}))
+"""
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="앱 import/시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="리포트에 포함할 상위 import 모듈 수")
+    parser.add_argument("--output", type=str, default="startup_results.json", help="결과 JSON 파일 경로")
+    return parser.parse_args()
+
+def run_once(env: dict) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", MEASURE_SCRIPT], env=env, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+"""
+-X importtime 출력에서 누적 시간(us) 기준 상위 모듈 추출
+"""
+def import_profile(env: dict, top: int) -> list[dict]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        modules.append({"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+
+    modules.sort(key=lambda module: module["cumulative_ms"], reverse=True)
+    return modules[:top]
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{os.path.join(tmp_dir, 'startup.db')}"}
+
+        # 첫 실행은 스키마를 생성하는 콜드 DB, 이후는 마이그레이션이 필요 없는 웜 DB
+        runs = [run_once(env) for _ in range(args.runs)]
+        modules = import_profile(env, args.top)
+
+    warm = runs[1:] or runs
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "runs": args.runs,
+        "first_run": runs[0],
+        "import_ms_median": round(statistics.median(run["import_ms"] for run in warm), 1),
+        "startup_ms_median": round(statistics.median(run["startup_ms"] for run in warm), 1),
+        "top_imports": modules,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"import 중앙값: {report['import_ms_median']}ms, 시작 중앙값: {report['startup_ms_median']}ms")
+    print(f"첫 실행(스키마 생성): import {runs[0]['import_ms']:.1f}ms, 시작 {runs[0]['startup_ms']:.1f}ms")
+    for module in modules:
+        print(f"{module['cumulative_ms']:>10.1f}ms  {module['module']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+사용자 일괄 등록 벤치마크
+
+같은 CSV 파일을 해시 프로세스 수(BULK_IMPORT_WORKERS)를 바꿔 가며 새 DB에 등록하고
+소요 시간과 1개 프로세스 대비 배율을 출력합니다.
+
+실행 예:
+    python -m benchmarks.user_import --users 2000 --workers 1 2 4 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="사용자 일괄 등록 벤치마크")
+    parser.add_argument("--users", type=int, default=2000, help="등록할 사용자 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count()], help="해시 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=500, help="트랜잭션당 사용자 수")
+    return parser.parse_args()
+
+def run_import(path: str, workers: int, batch_size: int, directory: str) -> float:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{os.path.join(directory, f'import-{workers}.db')}",
+        "BULK_IMPORT_WORKERS": str(workers),
+    }
+    result = subprocess.run(
+        [sys.executable, "-m", "src.app.services.user_import", path, "--batch-size", str(batch_size)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    summary = json.loads(result.stdout.strip().splitlines()[-1])["summary"]
+    if summary["duplicate"] or summary["invalid"]:
+        raise RuntimeError(f"일부 사용자가 등록되지 않았습니다: {summary}")
+    return summary["seconds"]
+
+def main():
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "users.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("email,username,password\n")
+            for i in range(args.users):
+                f.write(f"user{i}@example.com,user{i},password{i}\n")
+
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            seconds = run_import(path, workers, args.batch_size, directory)
+            baseline = baseline or seconds
+            print(f"workers={workers:<3}{seconds:>8.2f}s  ({baseline / seconds:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.app.core import query_profiler
+from src.app.dependencies.auth import get_current_user
+from src.app.models.user import User
+
+router = APIRouter()
+
+"""
+누적 실행 시간 기준 상위 쿼리 조회
+쿼리 프로파일러가 켜진 경우에만 등록됨
+인증된 사용자만 접근 가능
+"""
+@router.get(
+        "/queries",
+        summary="상위 쿼리 통계",
+        description="누적 실행 시간이 긴 순서로 쿼리 형태별 통계를 조회합니다.",
+)
+def get_top_queries(
+    limit: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(get_current_user)
+):
+    return query_profiler.top_statements(limit)
+
+"""
+쿼리 통계 초기화
+인증된 사용자만 접근 가능
+"""
+@router.delete(
+        "/queries",
+        summary="쿼리 통계 초기화",
+        description="누적된 쿼리 통계를 초기화합니다.",
+)
+def reset_queries(current_user: User = Depends(get_current_user)):
+    query_profiler.reset_stats()
+
+    return {"message": "쿼리 통계가 초기화되었습니다."}
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Response
+from starlette.concurrency import run_in_threadpool
+
+from src.app.core.metrics import render_metrics, sample_threadpool
+
+router = APIRouter()
+
+"""
+Prometheus 수집용 메트릭 조회
+"""
+@router.get(
+        "/metrics",
+        summary="Prometheus 메트릭",
+        description="Prometheus 텍스트 포맷으로 서버 메트릭을 조회합니다.",
+        include_in_schema=False,
+)
+async def get_metrics():
+    # 스레드풀 사용량은 이벤트 루프에서 수집 시점에 기록 (메트릭 생성은 스레드풀에서)
+    sample_threadpool()
+    data, content_type = await run_in_threadpool(render_metrics)
+
+    return Response(content=data, media_type=content_type)
@@ -1,14 +1,40 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 
+from src.app.core.transfers import TransferFileResponse
 from src.app.dependencies.auth import get_current_user
 from src.app.models.user import User
-from src.app.schemas.post import PostCreate, PostResponse, PostUpdate
+from src.app.schemas.post import AttachmentResponse, PostCreate, PostResponse, PostStatsResponse, PostUpdate
+from src.app.services.attachment_service import (
+    AttachmentService,
+    attachment_path,
+    get_attachment_service,
+    receive_attachment,
+)
+from src.app.services.post_feed import FEED_PAGE_SIZE, FEED_SIZE
 from src.app.services.post_service import PostService, get_post_service
 
 
 router = APIRouter()
 
+"""
+If-Match 헤더에서 기대 버전을 추출 (없거나 "*"이면 None)
+"""
+def parse_if_match(if_match: str | None = Header(None)) -> int | None:
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    tag = if_match.strip().removeprefix("W/").strip('"')
+    if not tag.isdigit():
+        raise HTTPException(status_code=400, detail="잘못된 If-Match 헤더입니다.")
+
+    return int(tag)
+
+def set_etag(response: Response, post):
+    response.headers["ETag"] = f'"{post.version}"'
+
 """
 게시글 생성
 인증된 사용자만 접근 가능
@@ -36,7 +62,11 @@ def create_post(
         "/",
         response_model=List[PostResponse],
         summary="게시글 목록 조회",
-        description="전체 게시글 목록을 최신순으로 조회합니다.",
+        description=(
+            "게시글 목록을 최신순(작성 시각 역순, 같으면 ID 역순)으로 페이지 단위로 조회합니다. "
+            f"page/size를 생략하면 최신 {FEED_PAGE_SIZE}개를 반환하며, size는 최대 {FEED_SIZE}입니다. "
+            "첫 페이지는 최신 게시글 피드(Redis)에서 같은 응답 스키마로 반환합니다."
+        ),
         responses={
             404: {
                 "description": "게시글 조회 실패",
@@ -50,8 +80,18 @@ def create_post(
             }
         }
 )
-def get_posts(post_service: PostService = Depends(get_post_service)):
-    posts = post_service.get_posts()
+def get_posts(
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터)"),
+    size: int = Query(FEED_PAGE_SIZE, ge=1, le=FEED_SIZE, description="페이지당 게시글 수"),
+    post_service: PostService = Depends(get_post_service),
+):
+    # 첫 페이지: 피드를 응답 모델과 같은 스키마로 직렬화해 바로 응답 (SQL 없음)
+    if page == 1:
+        feed = post_service.get_feed(size)
+        if feed is not None:
+            return Response(content=feed, media_type="application/json")
+
+    posts = post_service.get_posts(page, size)
 
     if posts is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
@@ -80,13 +120,49 @@ def get_posts(post_service: PostService = Depends(get_post_service)):
             }
         }
 )
-def get_post(post_id: int, post_service: PostService = Depends(get_post_service)):
+def get_post(post_id: int, request: Request, response: Response, post_service: PostService = Depends(get_post_service)):
     post = post_service.get_post(post_id)
 
     if post is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    # 순 방문자 식별: 클라이언트 IP + User-Agent
+    client = request.client.host if request.client else ""
+    post_service.record_view(post_id, f"{client}|{request.headers.get('user-agent', '')}")
+
+    set_etag(response, post)
     return post
 
+"""
+게시글 조회수 통계
+모든 사용자 접근 가능
+"""
+@router.get(
+        "/{post_id}/stats",
+        response_model=PostStatsResponse,
+        summary="게시글 조회수 조회",
+        description="게시글의 누적 조회수와 순 방문자 수(근사치)를 조회합니다.",
+        responses={
+            404: {
+                "description": "게시글 조회 실패",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "게시글을 찾을 수 없습니다.",
+                        }
+                    }
+                }
+            }
+        }
+)
+def get_post_stats(post_id: int, post_service: PostService = Depends(get_post_service)):
+    stats = post_service.get_post_stats(post_id)
+
+    if stats is None:
+        raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    return stats
+
 """
 게시글 수정
 인증된 사용자만 접근 가능
@@ -106,20 +182,33 @@ def get_post(post_id: int, post_service: PostService = Depends(get_post_service)
                         }
                     }
                 }
+            },
+            412: {
+                "description": "If-Match 버전 불일치",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "게시글이 다른 요청에 의해 변경되었습니다.",
+                        }
+                    }
+                }
             }
         }
 )
 def update_post(
     post_id: int, 
     post_update: PostUpdate, 
+    response: Response,
+    expected_version: int | None = Depends(parse_if_match),
     post_service: PostService = Depends(get_post_service),
     current_user: User = Depends(get_current_user)
 ):
-    post = post_service.update_post(post_id, post_update, current_user)
+    post = post_service.update_post(post_id, post_update, current_user, expected_version)
 
     if post is None:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
+    set_etag(response, post)
     return post
 
 """
@@ -151,17 +240,184 @@ def update_post(
                     }
                 }
             },
+        },
+            412: {
+                "description": "If-Match 버전 불일치",
+                "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "게시글이 다른 요청에 의해 변경되었습니다.",
+                    }
+                }
+            },
         }
     }
 )
 def delete_post(
     post_id: int, 
+    expected_version: int | None = Depends(parse_if_match),
     post_service: PostService = Depends(get_post_service),
     current_user: User = Depends(get_current_user)
 ):
-    post = post_service.delete_post(post_id, current_user)
+    post = post_service.delete_post(post_id, current_user, expected_version)
 
     if post is False:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
-    return {"message": "게시글이 성공적으로 삭제되었습니다."}
\ No newline at end of file
+    return {"message": "게시글이 성공적으로 삭제되었습니다."}
+
+"""
+첨부 파일 업로드
+게시글 작성자만 접근 가능
+본문을 청크 단위로 읽어 바로 디스크에 기록 (파일 전체를 메모리에 올리지 않음)
+"""
+@router.post(
+        "/{post_id}/attachments",
+        response_model=AttachmentResponse,
+        status_code=201,
+        summary="첨부 파일 업로드",
+        description="게시글에 파일을 첨부합니다. multipart/form-data의 file 필드로 업로드합니다.",
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "multipart/form-data": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {"file": {"type": "string", "format": "binary"}},
+                            "required": ["file"],
+                        }
+                    }
+                },
+            }
+        },
+        responses={
+            404: {
+                "description": "게시글이 없거나 작성자가 아님",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "게시글을 찾을 수 없습니다.",
+                        }
+                    }
+                }
+            },
+            413: {
+                "description": "첨부 파일 크기 초과",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "파일은 10485760바이트 이하여야 합니다.",
+                        }
+                    }
+                }
+            }
+        }
+)
+async def upload_attachment(
+    post_id: int,
+    request: Request,
+    attachment_service: AttachmentService = Depends(get_attachment_service),
+    current_user: User = Depends(get_current_user)
+):
+    # 본문을 읽기 전에 권한부터 확인 (DB 작업은 스레드 풀에서)
+    # 업로드 중 게시글이 삭제되는 경우는 create_attachment의 조건부 INSERT에서 다시 확인
+    await run_in_threadpool(attachment_service.check_post_owner, post_id, current_user)
+
+    received = await receive_attachment(request)
+    attachment = await run_in_threadpool(attachment_service.create_attachment, post_id, received, current_user)
+
+    return attachment
+
+"""
+게시글 첨부 파일 목록
+모든 사용자 접근 가능
+"""
+@router.get(
+        "/{post_id}/attachments",
+        response_model=List[AttachmentResponse],
+        summary="첨부 파일 목록 조회",
+        description="게시글의 첨부 파일 정보를 조회합니다.",
+)
+def get_attachments(post_id: int, attachment_service: AttachmentService = Depends(get_attachment_service)):
+    return attachment_service.get_attachments(post_id)
+
+"""
+첨부 파일 다운로드
+모든 사용자 접근 가능
+파일은 TransferFileResponse로 전송 (Range 요청 지원, 파일 읽기는 전송용 스레드에서)
+ETag는 내용의 SHA-256이며 If-None-Match가 일치하면 304
+"""
+@router.get(
+        "/{post_id}/attachments/{attachment_id}",
+        response_class=FileResponse,
+        summary="첨부 파일 다운로드",
+        description="첨부 파일을 내려받습니다. Range 요청으로 일부만 받을 수 있습니다.",
+        responses={
+            404: {
+                "description": "첨부 파일 조회 실패",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "첨부 파일을 찾을 수 없습니다.",
+                        }
+                    }
+                }
+            }
+        }
+)
+def download_attachment(
+    post_id: int,
+    attachment_id: int,
+    if_none_match: str | None = Header(None),
+    attachment_service: AttachmentService = Depends(get_attachment_service),
+):
+    attachment = attachment_service.get_attachment(post_id, attachment_id)
+
+    if attachment is None:
+        raise HTTPException(status_code=404, detail="첨부 파일을 찾을 수 없습니다.")
+
+    etag = f'"{attachment.sha256}"'
+    if if_none_match is not None and etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    # 업로드된 파일은 브라우저에서 바로 실행되지 않도록 항상 다운로드로 전송
+    return TransferFileResponse(
+        attachment_path(attachment.storage_key),
+        media_type=attachment.content_type,
+        filename=attachment.filename,
+        headers={"ETag": etag},
+    )
+
+"""
+첨부 파일 삭제
+게시글 작성자만 접근 가능
+"""
+@router.delete(
+        "/{post_id}/attachments/{attachment_id}",
+        response_model=dict,
+        summary="첨부 파일 삭제",
+        description="게시글의 첨부 파일을 삭제합니다.",
+        responses={
+            404: {
+                "description": "첨부 파일 삭제 실패",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "첨부 파일을 찾을 수 없습니다.",
+                        }
+                    }
+                }
+            }
+        }
+)
+def delete_attachment(
+    post_id: int,
+    attachment_id: int,
+    attachment_service: AttachmentService = Depends(get_attachment_service),
+    current_user: User = Depends(get_current_user)
+):
+    if not attachment_service.delete_attachment(post_id, attachment_id, current_user):
+        raise HTTPException(status_code=404, detail="첨부 파일을 찾을 수 없습니다.")
+
+    return {"message": "첨부 파일이 성공적으로 삭제되었습니다."}
\ No newline at end of file
@@ -1,5 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
-from src.app.schemas.user import UserCreate, UserResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import EmailStr
+from starlette.concurrency import run_in_threadpool
+from src.app.core.uploads import receive_file, remove_file
+from src.app.dependencies.auth import get_bulk_import_admin, get_current_user
+from src.app.models.user import User
+from src.app.schemas.post import UserPostsResponse
+from src.app.services.post_service import USER_POSTS_PAGE_SIZE, PostService, get_post_service
+from src.app.schemas.user import UserAvailabilityResponse, UserCreate, UserResponse
+from src.app.services.user_import import (
+    BULK_IMPORT_MAX_ROWS,
+    BULK_IMPORT_MAX_SIZE,
+    BULK_IMPORT_UPLOAD_DIR,
+    detect_format,
+    exceeds_row_limit,
+    import_uploaded_file_ndjson,
+    release_import_slot,
+    try_acquire_import_slot,
+)
 from src.app.services.user_service import UserService, get_user_service
 
 router = APIRouter()
@@ -12,7 +30,7 @@ router = APIRouter()
         description="새로운 사용자를 등록합니다.",
         responses={
             409: {
-                "description": "중복된 이메일로 회원가입 시도",
+                "description": "중복된 이메일 또는 사용자 이름으로 회원가입 시도",
                 "content": {
                     "application/json": {
                         "example": {
@@ -24,14 +42,210 @@ router = APIRouter()
         }
 )
 def register_user(user: UserCreate, user_service: UserService = Depends(get_user_service)):
-    existed_user = user_service.get_user_by_email(user.email)
+    # 중복 여부는 INSERT 시 고유 제약 조건으로 확인 (409)
+    created_user = user_service.create_user(user)
+
+    return created_user
 
-    if existed_user:
+# 이메일/사용자 이름 사용 가능 여부 (회원가입 폼 실시간 확인)
+@router.get(
+        "/users/availability",
+        response_model=UserAvailabilityResponse,
+        summary="이메일/사용자 이름 사용 가능 여부",
+        description="회원가입 전에 이메일과 사용자 이름을 사용할 수 있는지 확인합니다.",
+        responses={
+            400: {
+                "description": "확인할 항목 없음",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "email 또는 username을 입력해주세요.",
+                        }
+                    }
+                }
+            }
+        }
+)
+def check_availability(
+    email: EmailStr | None = None,
+    username: str | None = None,
+    user_service: UserService = Depends(get_user_service),
+):
+    if email is None and username is None:
         raise HTTPException(
-            status_code=409,
-            detail="이미 존재하는 이메일입니다."
+            status_code=400,
+            detail="email 또는 username을 입력해주세요."
         )
-    
-    created_user = user_service.create_user(user)
 
-    return created_user
\ No newline at end of file
+    return UserAvailabilityResponse(
+        email=user_service.is_available("email", email) if email is not None else None,
+        username=user_service.is_available("username", username) if username is not None else None,
+    )
+
+# 작성자별 게시글 목록 (최신순, 커서 기반 페이지네이션)
+@router.get(
+        "/users/{user_id}/posts",
+        response_model=UserPostsResponse,
+        summary="작성자별 게시글 목록",
+        description="사용자가 작성한 게시글을 최신순으로 조회합니다. 다음 페이지는 응답의 next_cursor를 cursor로 전달해 조회합니다.",
+        responses={
+            400: {
+                "description": "잘못된 커서",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "잘못된 커서입니다.",
+                        }
+                    }
+                }
+            },
+            404: {
+                "description": "사용자를 찾을 수 없음",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "사용자를 찾을 수 없습니다.",
+                        }
+                    }
+                }
+            }
+        }
+)
+def get_user_posts(
+    user_id: int,
+    limit: int = Query(USER_POSTS_PAGE_SIZE, ge=1, le=100),
+    cursor: str | None = None,
+    post_service: PostService = Depends(get_post_service),
+):
+    result = post_service.get_user_posts(user_id, limit, cursor)
+    if result is None:
+        raise HTTPException(
+            status_code=404,
+            detail="사용자를 찾을 수 없습니다."
+        )
+
+    return result
+
+# 사용자 일괄 등록 (CSV/NDJSON 업로드, 행별 결과를 NDJSON으로 스트리밍)
+@router.post(
+        "/users/import",
+        summary="사용자 일괄 등록",
+        description=(
+            "CSV(email,username,password 헤더) 또는 NDJSON 파일의 사용자를 일괄 등록합니다. "
+            "행별 결과(created, duplicate, invalid)와 마지막 요약을 NDJSON으로 스트리밍합니다. "
+            "multipart/form-data의 file 필드로 업로드합니다. "
+            "BULK_IMPORT_ADMINS에 등록된 사용자만 사용할 수 있고, "
+            "요청 하나에 BULK_IMPORT_MAX_ROWS행까지, 워커별로 BULK_IMPORT_MAX_CONCURRENT건씩 처리합니다."
+        ),
+        openapi_extra={
+            "requestBody": {
+                "required": True,
+                "content": {
+                    "multipart/form-data": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {"file": {"type": "string", "format": "binary"}},
+                            "required": ["file"],
+                        }
+                    }
+                },
+            }
+        },
+        responses={
+            200: {
+                "description": "행별 처리 결과",
+                "content": {
+                    "application/x-ndjson": {
+                        "example": '{"line": 2, "status": "created", "email": "user@example.com", "id": 1}\n',
+                    }
+                }
+            },
+            400: {
+                "description": "지원하지 않는 파일 형식",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "CSV 또는 NDJSON 파일만 등록할 수 있습니다.",
+                        }
+                    }
+                }
+            },
+            403: {
+                "description": "일괄 등록 권한 없음",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "사용자 일괄 등록 권한이 없습니다.",
+                        }
+                    }
+                }
+            },
+            413: {
+                "description": "업로드 파일 크기 또는 행 수 초과",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "파일은 104857600바이트 이하여야 합니다.",
+                        }
+                    }
+                }
+            },
+            429: {
+                "description": "다른 일괄 등록이 진행 중",
+                "content": {
+                    "application/json": {
+                        "example": {
+                            "detail": "다른 일괄 등록이 진행 중입니다. 잠시 후 다시 시도해주세요.",
+                        }
+                    }
+                }
+            }
+        }
+)
+async def import_users(
+    request: Request,
+    format: str | None = None,
+    current_user: User = Depends(get_bulk_import_admin),
+):
+    if format is not None and format not in ("csv", "ndjson"):
+        raise HTTPException(
+            status_code=400,
+            detail="CSV 또는 NDJSON 파일만 등록할 수 있습니다."
+        )
+
+    # 업로드를 받기 전에 슬롯 확인 (결과 스트리밍이 끝날 때까지 유지)
+    if not try_acquire_import_slot():
+        raise HTTPException(
+            status_code=429,
+            detail="다른 일괄 등록이 진행 중입니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "10"},
+        )
+
+    received = None
+    try:
+        # 본문을 청크 단위로 읽어 file 필드만 임시 파일에 기록 (메모리에 쌓지 않음)
+        received = await receive_file(request, "file", BULK_IMPORT_UPLOAD_DIR, BULK_IMPORT_MAX_SIZE)
+
+        fmt = format or detect_format(received.filename, received.content_type)
+        if fmt not in ("csv", "ndjson"):
+            raise HTTPException(
+                status_code=400,
+                detail="CSV 또는 NDJSON 파일만 등록할 수 있습니다."
+            )
+        # 일부만 등록되지 않도록 처리 전에 행 수 확인
+        if await run_in_threadpool(exceeds_row_limit, received.path, fmt):
+            raise HTTPException(
+                status_code=413,
+                detail=f"한 번에 최대 {BULK_IMPORT_MAX_ROWS}행까지 등록할 수 있습니다."
+            )
+    except BaseException:
+        if received is not None:
+            remove_file(received.path)
+        release_import_slot()
+        raise
+
+    # 임시 파일 삭제와 슬롯 반납은 결과 스트리밍이 끝나면 실행
+    return StreamingResponse(
+        import_uploaded_file_ndjson(received.path, fmt, on_close=release_import_slot),
+        media_type="application/x-ndjson",
+    )
\ No newline at end of file
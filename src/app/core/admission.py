@@ -0,0 +1,237 @@
+import asyncio
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.app.core import timing
+from src.app.core.metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DELAY, ADMISSION_SHED
+
+# 부하 제어 사용 여부
+ADMISSION_CONTROL_ENABLED = True
+
+# 동기 엔드포인트가 실행되는 스레드풀 크기 (anyio 기본값 40)
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "40"))
+
+# 전체 동시 처리 요청 수 상한 (기본: 스레드풀 크기 - 스레드풀 앞 대기열을 보이는 곳으로 옮김)
+ADMISSION_MAX_IN_FLIGHT = int(os.environ.get("ADMISSION_MAX_IN_FLIGHT", str(THREADPOOL_SIZE)))
+
+# 거절 응답의 Retry-After (초)
+ADMISSION_RETRY_AFTER = 1
+
+"""
+경로 분류별 제한
+- priority: 처리 슬롯이 비면 값이 작은 분류의 대기 요청부터 처리
+- max_in_flight: 분류별 동시 처리 상한 (비싼 로그인이 스레드풀을 독차지하지 않도록)
+- max_queue: 대기열 길이 상한 (초과 시 즉시 거절)
+- target_delay / interval: CoDel 파라미터 (초)
+  대기 시간이 interval 동안 계속 target_delay를 넘으면 대기열이 빌 때까지 초과 요청을 거절
+- max_wait: 대기 시간 상한 (초과 시 거절)
+- shared: 전체 동시 처리 상한(ADMISSION_MAX_IN_FLIGHT)에 포함할지 여부
+  파일 전송은 네트워크 속도에 따라 슬롯을 오래 잡으므로 별도 상한만 적용
+  (전송의 파일 읽기/쓰기도 기본 스레드풀이 아닌 core.transfers의 전송용 스레드에서 실행)
+"""
+ROUTE_CLASS_LIMITS = {
+    "read": {"priority": 0, "max_in_flight": 40, "max_queue": 200, "target_delay": 0.05, "interval": 0.5, "max_wait": 2.0},
+    "write": {"priority": 1, "max_in_flight": 24, "max_queue": 100, "target_delay": 0.05, "interval": 0.5, "max_wait": 2.0},
+    "auth": {"priority": 2, "max_in_flight": 8, "max_queue": 50, "target_delay": 0.1, "interval": 0.5, "max_wait": 2.0},
+    "transfer": {"priority": 3, "max_in_flight": 64, "max_queue": 100, "target_delay": 0.5, "interval": 1.0, "max_wait": 5.0, "shared": False},
+}
+
+# 부하 제어 대상에서 제외할 경로 (헬스 체크, 메트릭, 문서)
+EXEMPT_PATHS = {"/", "/ping", "/metrics", "/docs", "/redoc", "/openapi.json"}
+EXEMPT_PREFIXES = ("/debug/",)
+
+# 비밀번호 해시(bcrypt)를 거치는 비싼 경로
+AUTH_PATHS = {"/register"}
+AUTH_PREFIXES = ("/auth/",)
+
+# 본문/응답 전송이 오래 걸리는 경로 (첨부 파일 업로드/다운로드)
+# 사용자 일괄 등록은 비밀번호 해시로 CPU를 쓰므로 write로 분류 (동시 실행 수는 BULK_IMPORT_MAX_CONCURRENT로 제한)
+TRANSFER_ROUTES = (
+    ("POST", re.compile(r"^/posts/\d+/attachments/?$")),
+    ("GET", re.compile(r"^/posts/\d+/attachments/\d+/?$")),
+    ("HEAD", re.compile(r"^/posts/\d+/attachments/\d+/?$")),
+)
+
+"""
+요청을 경로 분류(auth, transfer, read, write)로 나눔, 제외 대상이면 None
+"""
+def classify(method: str, path: str) -> str | None:
+    if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
+        return None
+    if any(method == route_method and pattern.match(path) for route_method, pattern in TRANSFER_ROUTES):
+        return "transfer"
+    if path in AUTH_PATHS or path.startswith(AUTH_PREFIXES):
+        return "auth"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+"""
+부하로 요청을 거절할 때 발생
+"""
+class AdmissionRejected(Exception):
+    def __init__(self, route_class: str, reason: str):
+        super().__init__(f"{route_class}: {reason}")
+        self.route_class = route_class
+        self.reason = reason
+
+@dataclass
+class _RouteClass:
+    name: str
+    priority: int
+    max_in_flight: int
+    max_queue: int
+    target_delay: float
+    interval: float
+    max_wait: float
+    shared: bool = True
+    in_flight: int = 0
+    waiters: deque = field(default_factory=deque)  # (도착 시각, future)
+    first_above_time: float = 0.0  # 대기 시간이 target을 처음 넘은 뒤 interval이 지나는 시각
+    dropping: bool = False
+
+    """
+    CoDel: 대기열에서 꺼낸 요청의 대기 시간으로 혼잡 상태 갱신, 거절 여부 반환
+    """
+    def should_drop(self, sojourn: float, now: float) -> bool:
+        if sojourn < self.target_delay:
+            self.first_above_time = 0.0
+            self.dropping = False
+            return False
+
+        if self.first_above_time == 0.0:
+            self.first_above_time = now + self.interval
+        elif now >= self.first_above_time:
+            self.dropping = True
+        return self.dropping
+
+"""
+경로 분류별 동시 처리 수와 대기열을 관리하는 부하 제어기 (이벤트 루프 안에서만 사용)
+
+처리 슬롯(전체 max_in_flight)이 비면 우선순위가 높은 분류의 대기 요청부터 처리하고,
+대기 시간이 계속 목표치를 넘는 분류(CoDel 혼잡 상태)는 대기열이 빌 때까지 새 요청을 즉시 거절합니다.
+"""
+class AdmissionController:
+    def __init__(self, limits: dict[str, dict], max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.classes = {name: _RouteClass(name, **options) for name, options in limits.items()}
+        self._by_priority = sorted(self.classes.values(), key=lambda route_class: route_class.priority)
+
+    def _has_capacity(self, route_class: _RouteClass) -> bool:
+        if route_class.in_flight >= route_class.max_in_flight:
+            return False
+        return not route_class.shared or self.in_flight < self.max_in_flight
+
+    def _higher_priority_waiting(self, route_class: _RouteClass) -> bool:
+        # 전체 상한을 쓰지 않는 분류는 다른 분류와 슬롯을 다투지 않음
+        if not route_class.shared:
+            return False
+        return any(
+            other.waiters for other in self._by_priority
+            if other.priority < route_class.priority and self._has_capacity(other)
+        )
+
+    def _admit(self, route_class: _RouteClass, sojourn: float):
+        if route_class.shared:
+            self.in_flight += 1
+        route_class.in_flight += 1
+        ADMISSION_IN_FLIGHT.labels(route_class.name).inc()
+        ADMISSION_QUEUE_DELAY.labels(route_class.name).observe(sojourn)
+
+    def _reject(self, route_class: _RouteClass, reason: str):
+        ADMISSION_SHED.labels(route_class.name, reason).inc()
+        raise AdmissionRejected(route_class.name, reason)
+
+    """
+    처리 슬롯을 얻을 때까지 대기 (거절되면 AdmissionRejected)
+    """
+    async def acquire(self, name: str):
+        route_class = self.classes[name]
+        now = time.monotonic()
+
+        if self._has_capacity(route_class) and not route_class.waiters and not self._higher_priority_waiting(route_class):
+            route_class.should_drop(0.0, now)
+            self._admit(route_class, 0.0)
+            return
+
+        # 혼잡 상태이거나 대기열이 가득 차면 기다리지 않고 바로 거절
+        if route_class.dropping:
+            self._reject(route_class, "congested")
+        if len(route_class.waiters) >= route_class.max_queue:
+            self._reject(route_class, "queue_full")
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (now, future)
+        route_class.waiters.append(waiter)
+        try:
+            admitted = await asyncio.wait_for(asyncio.shield(future), route_class.max_wait)
+        except asyncio.TimeoutError:
+            admitted = None
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 취소된 경우, 이미 받은 슬롯은 반납
+            if future.done() and future.result():
+                self.release(name)
+            elif not future.done():
+                future.cancel()
+                route_class.waiters.remove(waiter)
+            raise
+
+        if admitted is None:
+            if future.done():
+                admitted = future.result()
+            else:
+                future.cancel()
+                route_class.waiters.remove(waiter)
+                route_class.should_drop(time.monotonic() - now, time.monotonic())
+                self._reject(route_class, "timeout")
+
+        if not admitted:
+            self._reject(route_class, "congested")
+
+        # 대기한 요청만 Server-Timing에 대기 시간 기록 (_dispatch는 다른 요청의 컨텍스트에서 실행됨)
+        timing.record("queue", time.monotonic() - now)
+
+    """
+    처리 슬롯 반납 후 우선순위 순서로 대기 요청 처리
+    """
+    def release(self, name: str):
+        route_class = self.classes[name]
+        if route_class.shared:
+            self.in_flight -= 1
+        route_class.in_flight -= 1
+        ADMISSION_IN_FLIGHT.labels(name).dec()
+        self._dispatch()
+
+    def _dispatch(self):
+        now = time.monotonic()
+        for route_class in self._by_priority:
+            while route_class.waiters and self._has_capacity(route_class):
+                arrived_at, future = route_class.waiters.popleft()
+                if future.done():
+                    continue
+
+                sojourn = now - arrived_at
+                if route_class.should_drop(sojourn, now):
+                    # CoDel: 오래 기다린 요청은 처리하지 않고 거절 (클라이언트는 곧 재시도)
+                    future.set_result(False)
+                    continue
+
+                self._admit(route_class, sojourn)
+                future.set_result(True)
+
+            if not route_class.waiters:
+                route_class.dropping = False
+
+"""
+기본 스레드풀 크기 설정 (이벤트 루프 안에서 호출)
+"""
+def configure_threadpool(size: int = THREADPOOL_SIZE):
+    from anyio import to_thread
+
+    to_thread.current_default_thread_limiter().total_tokens = size
+
+admission_controller = AdmissionController(ROUTE_CLASS_LIMITS, ADMISSION_MAX_IN_FLIGHT)
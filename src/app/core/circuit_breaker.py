@@ -0,0 +1,112 @@
+import threading
+import time
+
+from src.app.core.metrics import BREAKER_REJECTED, BREAKER_STATE, BREAKER_TRANSITIONS
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+"""
+외부 의존성(Redis 등)을 사용할 수 없을 때 발생
+"""
+class DependencyUnavailableError(Exception):
+    pass
+
+class CircuitOpenError(DependencyUnavailableError):
+    pass
+
+"""
+연속 실패가 임계치를 넘으면 일정 시간 호출을 즉시 거절하고(open),
+이후 한 번의 시험 호출(half_open)이 성공하면 다시 닫는 서킷 브레이커
+is_failure: 장애로 셀 예외인지 판단하는 함수 (그 외 예외는 그대로 전달)
+"""
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        is_failure,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+        on_state_change=None,
+    ):
+        self.name = name
+        self.is_failure = is_failure
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        BREAKER_STATE.on_create(lambda gauge: gauge.labels(name).set(_STATE_VALUES[CLOSED]))
+
+    def _transition(self, state: str):
+        previous, self.state = self.state, state
+        BREAKER_STATE.labels(self.name).set(_STATE_VALUES[state])
+        BREAKER_TRANSITIONS.labels(self.name, state).inc()
+        return previous
+
+    def _allow(self) -> bool:
+        # 닫힌 상태의 대부분 호출은 잠금 없이 통과
+        if self.state == CLOSED:
+            return True
+
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return self.state == CLOSED
+
+    def _on_success(self):
+        if self.state == CLOSED and self._failures == 0:
+            return
+
+        previous = None
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            if self.state != CLOSED:
+                previous = self._transition(CLOSED)
+
+        if previous is not None and self.on_state_change:
+            self.on_state_change(previous, CLOSED)
+
+    def _on_failure(self):
+        previous = None
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                if self.state != OPEN:
+                    previous = self._transition(OPEN)
+
+        if previous is not None and self.on_state_change:
+            self.on_state_change(previous, OPEN)
+
+    """
+    서킷 상태에 따라 func를 호출
+    열려 있으면 CircuitOpenError, 장애 예외면 DependencyUnavailableError 발생
+    """
+    def call(self, func, *args, **kwargs):
+        if not self._allow():
+            BREAKER_REJECTED.labels(self.name).inc()
+            raise CircuitOpenError(f"{self.name} 서킷이 열려 있습니다.")
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if not self.is_failure(e):
+                self._on_success()
+                raise
+            self._on_failure()
+            raise DependencyUnavailableError(f"{self.name} 호출 실패: {e}") from e
+
+        self._on_success()
+        return result
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from sqlalchemy import text
+
+from src.app.core import admission, metrics
+from src.app.core.migrations import migrate
+from src.app.core.redis_config import check_redis, close_redis
+from src.app.database import engine
+from src.app.services import token_service, user_filter, user_import, view_counter
+
+logger = logging.getLogger("app.startup")
+
+# 시작 시 헬스 체크 제한 시간 (초) - 초과해도 기동은 계속 진행
+HEALTH_CHECK_TIMEOUT = 3.0
+
+"""
+블로킹 함수를 스레드에서 실행하고 소요 시간(초)과 결과를 반환
+"""
+async def _timed_in_thread(func, *args, timeout: float | None = None):
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(asyncio.to_thread(func, *args), timeout)
+    except asyncio.TimeoutError:
+        result = "timeout"
+    return time.perf_counter() - start, result
+
+def check_db() -> bool:
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.error("DB 연결 실패: %s", e)
+        return False
+
+"""
+앱 시작/종료 처리
+스키마 마이그레이션(필요할 때만)과 DB/Redis 헬스 체크를 동시에 실행하고
+import 시간과 단계별 시작 시간을 리포트로 남김
+"""
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start = time.perf_counter()
+
+    (migrate_time, applied), (db_time, db_ok), (redis_time, redis_ok) = await asyncio.gather(
+        _timed_in_thread(migrate, engine),
+        _timed_in_thread(check_db, timeout=HEALTH_CHECK_TIMEOUT),
+        _timed_in_thread(check_redis, timeout=HEALTH_CHECK_TIMEOUT),
+    )
+
+    admission.configure_threadpool()
+    metrics.init_threadpool_metrics()
+    threadpool_sampler = None
+    if metrics.MULTIPROC_DIR:
+        threadpool_sampler = asyncio.create_task(metrics.sample_threadpool_periodically())
+
+    # 이전 실행(또는 종료된 워커)이 남긴 토큰 폐기 기록 재적용
+    if redis_ok is True:
+        token_service.TokenService.replay_buffered_revocations()
+        # 가입 중복 확인용 필터가 비어 있으면 users 테이블로 채움
+        user_filter.warm_in_background()
+    # 시작 시 Redis가 응답하지 않았거나 서킷 전환 없이 보관된 기록도 주기적으로 재적용
+    token_service.TokenService.start_revocation_replay()
+
+    # 블랙리스트 로컬 사본 구독 시작 (동기화 전까지는 Redis 직접 조회)
+    if token_service.BLACKLIST_MIRROR_ENABLED:
+        token_service.blacklist_mirror.start()
+
+    # 조회수 버퍼 반영 스레드 시작
+    if view_counter.VIEW_COUNTER_ENABLED:
+        view_counter.view_counter.start()
+
+    report = {
+        "import_ms": round(getattr(app.state, "import_seconds", 0.0) * 1000, 1),
+        "startup_ms": round((time.perf_counter() - start) * 1000, 1),
+        "migrate_ms": round(migrate_time * 1000, 1),
+        "migrations_applied": applied,
+        "db_check_ms": round(db_time * 1000, 1),
+        "db_ok": db_ok,
+        "redis_check_ms": round(redis_time * 1000, 1),
+        "redis_ok": redis_ok,
+    }
+    app.state.startup_report = report
+    logger.info("startup report: %s", report)
+
+    yield
+
+    if threadpool_sampler is not None:
+        threadpool_sampler.cancel()
+    token_service.TokenService.stop_revocation_replay()
+    token_service.blacklist_mirror.stop()
+    view_counter.view_counter.stop()  # 남은 조회수 반영
+    user_import.shutdown_hash_pool()
+    close_redis()
+    metrics.mark_worker_dead()
@@ -0,0 +1,239 @@
+import asyncio
+import os
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 멀티 워커 집계용 공유 디렉터리 (prometheus_client가 이 환경변수를 보고 mmap 파일에 기록)
+# 예: PROMETHEUS_MULTIPROC_DIR=/tmp/metrics uvicorn src.main:app --workers 4
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+# 멀티 워커 환경에서 워커별 스레드풀 사용량을 기록하는 주기 (초)
+THREADPOOL_SAMPLE_INTERVAL = 1.0
+
+# 요청 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_metrics_lock = threading.Lock()
+_lazy_metrics = []
+
+"""
+처음 사용할 때 prometheus_client를 불러와 만드는 메트릭
+모듈 import 시점에는 prometheus_client를 불러오지 않아 앱 import 시간에서 제외됨
+사용법은 prometheus_client의 Counter/Gauge/Histogram과 같음
+"""
+class _LazyMetric:
+    def __init__(self, kind: str, *args, **kwargs):
+        self._kind = kind
+        self._args = args
+        self._kwargs = kwargs
+        self._metric = None
+        self._on_create = []
+        _lazy_metrics.append(self)
+
+    def _get(self):
+        if self._metric is None:
+            with _metrics_lock:
+                if self._metric is None:
+                    import prometheus_client
+
+                    metric = getattr(prometheus_client, self._kind)(*self._args, **self._kwargs)
+                    for callback in self._on_create:
+                        callback(metric)
+                    self._metric = metric
+        return self._metric
+
+    """
+    메트릭이 만들어질 때 실행할 초기화 (이미 만들어졌으면 바로 실행)
+    """
+    def on_create(self, callback):
+        with _metrics_lock:
+            if self._metric is None:
+                self._on_create.append(callback)
+                return
+        callback(self._metric)
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+def Counter(*args, **kwargs) -> _LazyMetric:
+    return _LazyMetric("Counter", *args, **kwargs)
+
+def Gauge(*args, **kwargs) -> _LazyMetric:
+    return _LazyMetric("Gauge", *args, **kwargs)
+
+def Histogram(*args, **kwargs) -> _LazyMetric:
+    return _LazyMetric("Histogram", *args, **kwargs)
+
+# HTTP 요청
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "HTTP 요청 수",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    multiprocess_mode="livesum",
+)
+
+# 동기 엔드포인트가 실행되는 스레드풀 포화도
+THREADPOOL_IN_USE = Gauge(
+    "threadpool_threads_in_use",
+    "사용 중인 스레드풀 워커 수",
+    multiprocess_mode="livesum",
+)
+THREADPOOL_SIZE = Gauge(
+    "threadpool_threads_total",
+    "스레드풀 최대 워커 수",
+    multiprocess_mode="livesum",
+)
+
+# DB 커넥션 풀 포화도
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "사용 중인 DB 커넥션 수",
+    multiprocess_mode="livesum",
+)
+
+# Redis 명령 지연 시간
+REDIS_LATENCY = Histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 실행 시간",
+    ["command"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# 캐시 적중/미스
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "캐시 조회 수",
+    ["cache", "result"],
+)
+
+# 서킷 브레이커
+BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "서킷 브레이커 상태 (0: closed, 1: half_open, 2: open)",
+    ["name"],
+    multiprocess_mode="livemax",
+)
+BREAKER_TRANSITIONS = Counter(
+    "circuit_breaker_transitions_total",
+    "서킷 브레이커 상태 전환 수",
+    ["name", "state"],
+)
+BREAKER_REJECTED = Counter(
+    "circuit_breaker_rejected_total",
+    "서킷이 열려 있어 즉시 거절된 호출 수",
+    ["name"],
+)
+
+# 부하 제어 (경로 분류별 처리 중 요청 수, 대기 시간, 거절 수)
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "부하 제어를 통과해 처리 중인 요청 수",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DELAY = Histogram(
+    "admission_queue_delay_seconds",
+    "처리 슬롯을 얻기까지 대기한 시간",
+    ["route_class"],
+    buckets=LATENCY_BUCKETS,
+)
+ADMISSION_SHED = Counter(
+    "admission_shed_total",
+    "부하로 거절된 요청 수",
+    ["route_class", "reason"],
+)
+
+# Redis 장애 중 로컬에 보관된 토큰 폐기 (보관 - 재적용 = 미반영 건수)
+REVOCATIONS_BUFFERED = Counter(
+    "revocation_buffer_appended_total",
+    "Redis 장애로 로컬에 보관된 토큰 폐기 수",
+)
+REVOCATIONS_REPLAYED = Counter(
+    "revocation_buffer_replayed_total",
+    "Redis 복구 후 재적용된 토큰 폐기 수",
+)
+
+"""
+캐시 조회 결과(hit/miss)를 기록
+"""
+def record_cache(cache: str, hit: bool):
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+"""
+DB 커넥션 풀 checkout/checkin 이벤트로 사용 중인 커넥션 수를 추적
+"""
+def instrument_pool(engine: Engine):
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        DB_POOL_CHECKED_OUT.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        DB_POOL_CHECKED_OUT.dec()
+
+"""
+스레드풀 최대 워커 수 기록 (이벤트 루프 안에서 호출)
+"""
+def init_threadpool_metrics():
+    from anyio import to_thread
+
+    THREADPOOL_SIZE.set(to_thread.current_default_thread_limiter().total_tokens)
+
+"""
+현재 사용 중인 스레드풀 워커 수 기록 (이벤트 루프 안에서 호출)
+요청 시작 시점이 아니라 수집 시점에 기록해 요청이 끊긴 뒤에도 값이 남지 않도록 함
+"""
+def sample_threadpool():
+    from anyio import to_thread
+
+    THREADPOOL_IN_USE.set(to_thread.current_default_thread_limiter().borrowed_tokens)
+
+"""
+멀티 워커 환경에서는 수집 요청을 받은 워커 외의 값도 최신이 되도록 주기적으로 기록
+"""
+async def sample_threadpool_periodically(interval: float = THREADPOOL_SAMPLE_INTERVAL):
+    while True:
+        sample_threadpool()
+        await asyncio.sleep(interval)
+
+"""
+Prometheus 텍스트 포맷으로 메트릭 생성
+멀티 워커 환경에서는 공유 디렉터리의 모든 워커 값을 합산
+"""
+def render_metrics() -> tuple[bytes, str]:
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+    from prometheus_client import multiprocess
+
+    # 아직 한 번도 기록되지 않은 메트릭도 노출되도록 모두 생성
+    for metric in _lazy_metrics:
+        metric._get()
+
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+"""
+워커 종료 시 해당 프로세스의 live 게이지 값을 정리
+"""
+def mark_worker_dead():
+    if MULTIPROC_DIR:
+        from prometheus_client import multiprocess
+
+
+        multiprocess.mark_process_dead(os.getpid())
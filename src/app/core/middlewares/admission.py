@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.app.core import admission
+
+"""
+경로 분류별 처리 슬롯을 얻은 요청만 앱으로 전달하고,
+과부하 시에는 스레드풀에 쌓기 전에 503과 Retry-After로 거절하는 ASGI 미들웨어
+"""
+class AdmissionControlMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = admission.classify(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        controller = admission.admission_controller
+        try:
+            await controller.acquire(route_class)
+        except admission.AdmissionRejected:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "요청이 많아 잠시 후 다시 시도해 주세요."},
+                headers={"Retry-After": str(admission.ADMISSION_RETRY_AFTER)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(route_class)
+
+"""
+부하 제어 미들웨어 설정
+"""
+def setup_admission(app: FastAPI):
+    if admission.ADMISSION_CONTROL_ENABLED:
+        app.add_middleware(AdmissionControlMiddleware)
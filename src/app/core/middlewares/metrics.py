@@ -0,0 +1,45 @@
+import time
+
+from fastapi import FastAPI
+
+from src.app.core import metrics
+
+"""
+라우트 템플릿별 요청 수, 지연 시간, 처리 중인 요청 수를 기록하는 ASGI 미들웨어
+"""
+class PrometheusMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.REQUESTS_IN_PROGRESS.dec()
+
+            # 실제 경로 대신 라우트 템플릿(/posts/{post_id})을 라벨로 사용해 카디널리티 제한
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+
+            metrics.REQUEST_LATENCY.labels(scope["method"], route_path).observe(time.perf_counter() - start)
+            metrics.REQUEST_COUNT.labels(scope["method"], route_path, status_code).inc()
+
+"""
+메트릭 수집 미들웨어 설정
+"""
+def setup_metrics(app: FastAPI):
+    app.add_middleware(PrometheusMiddleware)
@@ -0,0 +1,37 @@
+from fastapi import FastAPI
+
+from src.app.core import query_profiler
+
+"""
+요청별 쿼리 수를 세고 같은 형태의 쿼리가 반복되면(N+1 의심) 경고하는 ASGI 미들웨어
+"""
+class QueryCountMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = query_profiler.start_request()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            total = sum(queries.values())
+            if total:
+                query_profiler.logger.info("%s %s: 쿼리 %d회", scope["method"], scope["path"], total)
+
+            for statement, count in queries.items():
+                if count > query_profiler.N_PLUS_ONE_THRESHOLD:
+                    query_profiler.logger.warning(
+                        "N+1 의심: %s %s 요청에서 같은 쿼리가 %d회 실행됨: %s",
+                        scope["method"], scope["path"], count, statement,
+                    )
+
+"""
+쿼리 프로파일러 미들웨어 설정
+"""
+def setup_query_profiler(app: FastAPI):
+    if query_profiler.QUERY_PROFILER_ENABLED:
+        app.add_middleware(QueryCountMiddleware)
@@ -0,0 +1,63 @@
+import json
+import logging
+import time
+
+from fastapi import FastAPI
+
+from src.app.core import timing
+
+access_logger = logging.getLogger("app.access")
+
+"""
+요청별 구간(db, redis, jwt, bcrypt) 소요 시간을 수집하여
+Server-Timing 헤더와 구조화된 접근 로그로 내보내는 ASGI 미들웨어
+"""
+class ServerTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        phases = timing.start_request()
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if timing.SERVER_TIMING_ENABLED:
+                    header = timing.format_server_timing(phases, time.perf_counter() - start)
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"server-timing", header.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 로그 레벨에서 걸러지는 경우 직렬화 비용도 들지 않도록 먼저 확인
+            if timing.ACCESS_LOG_ENABLED and access_logger.isEnabledFor(logging.INFO):
+                total = time.perf_counter() - start
+                access_logger.info(json.dumps({
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(total * 1000, 3),
+                    "phases": {
+                        phase: {"duration_ms": round(elapsed * 1000, 3), "count": count}
+                        for phase, (elapsed, count) in phases.items()
+                    },
+                }, ensure_ascii=False))
+
+"""
+구간별 지연 시간 측정 미들웨어 설정
+비활성화 시 미들웨어를 등록하지 않으므로 계측 지점은 ContextVar 조회 비용만 남음
+"""
+def setup_timing(app: FastAPI):
+    if timing.is_enabled():
+        app.add_middleware(ServerTimingMiddleware)
@@ -0,0 +1,129 @@
+import logging
+
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, select
+from sqlalchemy.engine import Connection, Engine
+
+from src.app.database import Base
+
+logger = logging.getLogger("app.migrations")
+
+# 현재 적용된 스키마 버전을 보관하는 테이블 (행 1개)
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, nullable=False),
+)
+
+"""
+컬럼이 없을 때만 ALTER TABLE ADD COLUMN 실행
+"""
+def add_column_if_missing(conn: Connection, table: str, column: str, ddl: str):
+    columns = {col["name"] for col in inspect(conn).get_columns(table)}
+    if column not in columns:
+        conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+"""
+1: 모델 기준 테이블 생성
+"""
+def _create_tables(conn: Connection):
+    # 모든 모델이 Base.metadata에 등록되도록 import
+    from src.app.models import attachment, post, user  # noqa: F401
+
+    Base.metadata.create_all(bind=conn)
+
+"""
+2: 기존 DB에 누락된 posts.author, posts.version 컬럼 추가
+"""
+def _add_post_author_and_version(conn: Connection):
+    add_column_if_missing(conn, "posts", "author", "VARCHAR")
+    add_column_if_missing(conn, "posts", "version", "INTEGER NOT NULL DEFAULT 1")
+
+"""
+3: posts.views(조회수) 컬럼 추가
+"""
+def _add_post_views(conn: Connection):
+    add_column_if_missing(conn, "posts", "views", "INTEGER NOT NULL DEFAULT 0")
+
+"""
+4: 작성자별 게시글 목록 인덱스, users.post_count 컬럼 추가 및 기존 게시글 수로 채우기
+"""
+def _add_author_index_and_post_count(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_posts_author_id_created_at_id ON posts (author_id, created_at, id)"
+    )
+    add_column_if_missing(conn, "users", "post_count", "INTEGER NOT NULL DEFAULT 0")
+    conn.exec_driver_sql(
+        "UPDATE users SET post_count = (SELECT COUNT(*) FROM posts WHERE posts.author_id = users.id)"
+    )
+
+"""
+5: 게시글 첨부 파일 메타데이터 테이블 생성 (이미 있으면 건너뜀)
+"""
+def _create_attachments(conn: Connection):
+    from src.app.models.attachment import Attachment
+
+    Attachment.__table__.create(bind=conn, checkfirst=True)
+
+"""
+6: 전체 게시글 최신순 목록 인덱스
+"""
+def _add_created_at_index(conn: Connection):
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_posts_created_at_id ON posts (created_at, id)"
+    )
+
+# (버전, 설명, 함수) - 새 스키마 변경은 맨 뒤에 추가
+# 신규 DB는 1번에서 최신 모델로 생성되므로 이후 마이그레이션은 반드시 멱등이어야 함
+MIGRATIONS = [
+    (1, "테이블 생성", _create_tables),
+    (2, "posts.author, posts.version 컬럼 추가", _add_post_author_and_version),
+    (3, "posts.views 컬럼 추가", _add_post_views),
+    (4, "posts(author_id, created_at, id) 인덱스, users.post_count 컬럼 추가", _add_author_index_and_post_count),
+    (5, "attachments 테이블 생성", _create_attachments),
+    (6, "posts(created_at, id) 인덱스", _add_created_at_index),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def _current_version(conn: Connection) -> int:
+    if not inspect(conn).has_table(schema_version.name):
+        return 0
+    return conn.execute(select(schema_version.c.version)).scalar() or 0
+
+"""
+저장된 스키마 버전을 확인하고 필요한 마이그레이션만 적용
+최신 버전이면 SELECT 한 번으로 끝나며, 여러 워커가 동시에 시작해도
+SQLite 쓰기 잠금(BEGIN IMMEDIATE)으로 한 워커만 마이그레이션을 수행
+반환값: 적용된 마이그레이션 버전 목록
+"""
+def migrate(engine: Engine) -> list[int]:
+    with engine.connect() as conn:
+        if _current_version(conn) >= LATEST_VERSION:
+            return []
+
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        is_sqlite = conn.dialect.name == "sqlite"
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if is_sqlite else "BEGIN")
+        try:
+            schema_version.create(conn, checkfirst=True)
+
+            # 잠금을 얻는 사이 다른 워커가 마이그레이션했을 수 있으므로 다시 확인
+            current = _current_version(conn)
+            for version, description, apply in MIGRATIONS:
+                if version <= current:
+                    continue
+                logger.info("스키마 마이그레이션 %d 적용: %s", version, description)
+                apply(conn)
+                applied.append(version)
+
+            if applied:
+                conn.execute(schema_version.delete())
+                conn.execute(schema_version.insert().values(version=applied[-1]))
+
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+
+    return applied
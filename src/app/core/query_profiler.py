@@ -0,0 +1,115 @@
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.query")
+
+# 쿼리 프로파일러 사용 여부 (운영 환경에서 필요할 때만 켬)
+# 예: QUERY_PROFILER_ENABLED=1 SLOW_QUERY_THRESHOLD_MS=200 uvicorn src.main:app
+QUERY_PROFILER_ENABLED = os.environ.get("QUERY_PROFILER_ENABLED", "").lower() in ("1", "true", "yes", "on")
+# 이 시간(ms)을 넘는 쿼리는 파라미터와 실행 계획을 함께 로그로 남김
+SLOW_QUERY_THRESHOLD_MS = int(os.environ.get("SLOW_QUERY_THRESHOLD_MS", "100"))
+# 한 요청에서 같은 형태의 쿼리가 이 횟수를 넘으면 N+1 의심 경고
+N_PLUS_ONE_THRESHOLD = 10
+
+# 실행 계획을 조회할 수 있는 구문
+_EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+# 요청 단위 쿼리 형태별 실행 횟수 {statement: count}
+_request_queries: ContextVar[dict | None] = ContextVar("request_queries", default=None)
+
+# 프로세스 전체 쿼리 형태별 통계 {statement: [횟수, 누적 초, 최대 초]}
+_stats: dict[str, list] = {}
+_stats_lock = threading.Lock()
+
+"""
+SQLite는 EXPLAIN QUERY PLAN, 그 외 DB는 EXPLAIN으로 실행 계획 조회
+"""
+def _explain(conn, statement: str, parameters) -> list:
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+def _record(conn, statement: str, parameters, executemany: bool, elapsed: float):
+    with _stats_lock:
+        entry = _stats.get(statement)
+        if entry is None:
+            _stats[statement] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+
+    queries = _request_queries.get()
+    if queries is not None:
+        queries[statement] = queries.get(statement, 0) + 1
+
+    elapsed_ms = elapsed * 1000
+    if elapsed_ms >= SLOW_QUERY_THRESHOLD_MS:
+        plan = None
+        if not executemany and statement.lstrip().upper().startswith(_EXPLAINABLE):
+            try:
+                plan = _explain(conn, statement, parameters)
+            except Exception as e:
+                plan = f"EXPLAIN 실패: {e}"
+        logger.warning(
+            "느린 쿼리 (%.1fms): %s | params=%r | plan=%r",
+            elapsed_ms, statement, parameters, plan,
+        )
+
+"""
+엔진에 쿼리 프로파일러 연결
+"""
+def instrument_engine(engine: Engine):
+    if not QUERY_PROFILER_ENABLED:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["profiler_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("profiler_start", None)
+        if start is not None:
+            _record(conn, statement, parameters, executemany, time.perf_counter() - start)
+
+"""
+누적 시간 기준 상위 쿼리 통계 조회
+"""
+def top_statements(limit: int = 20) -> list[dict]:
+    with _stats_lock:
+        items = [(statement, *entry) for statement, entry in _stats.items()]
+
+    items.sort(key=lambda item: item[2], reverse=True)
+    return [
+        {
+            "statement": statement,
+            "count": count,
+            "total_ms": round(total * 1000, 3),
+            "avg_ms": round(total * 1000 / count, 3),
+            "max_ms": round(maximum * 1000, 3),
+        }
+        for statement, count, total, maximum in items[:limit]
+    ]
+
+"""
+요청 단위 쿼리 집계를 시작하고 결과를 담을 dict를 반환
+"""
+def start_request() -> dict:
+    queries = {}
+    _request_queries.set(queries)
+    return queries
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
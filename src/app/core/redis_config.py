@@ -1,5 +1,9 @@
-import redis
-from fastapi import FastAPI
+import os
+import time
+
+from src.app.core import timing
+from src.app.core.circuit_breaker import CircuitBreaker
+from src.app.core.metrics import REDIS_LATENCY
 
 # Redis 연결 설정
 REDIS_HOST = "localhost"
@@ -7,29 +11,142 @@ REDIS_PORT = 6379
 REDIS_DB = 0
 REDIS_PASSWORD = None
 
+# Redis Cluster 시작 노드 목록 (예: "10.0.0.1:7000,10.0.0.2:7000"), 지정하면 클러스터 모드로 연결
+REDIS_CLUSTER_NODES = os.environ.get("REDIS_CLUSTER_NODES")
+
+# Redis가 느리거나 죽었을 때 스레드풀 워커가 오래 붙잡히지 않도록 짧은 타임아웃 사용
+REDIS_SOCKET_TIMEOUT = 0.25  # 명령 응답 대기 (초)
+REDIS_CONNECT_TIMEOUT = 0.25  # 연결 수립 대기 (초)
+REDIS_MAX_CONNECTIONS = 64
+
+# 서킷 브레이커 설정
+REDIS_BREAKER_FAILURE_THRESHOLD = 5  # 연속 실패 횟수
+REDIS_BREAKER_RESET_TIMEOUT = 5.0  # open 유지 시간 (초), 이후 시험 호출
+
+_client = None
+
+def is_cluster() -> bool:
+    return bool(REDIS_CLUSTER_NODES)
+
+"""
+Redis 클라이언트 생성 (REDIS_CLUSTER_NODES가 있으면 RedisCluster)
+redis 패키지 import 비용이 커서 앱 import 시점이 아닌 첫 사용 시점에 생성
+"""
+def get_redis_client():
+    global _client
+    if _client is not None:
+        return _client
+
+    import redis
+    from redis.backoff import NoBackoff
+    from redis.cluster import ClusterNode, RedisCluster
+    from redis.retry import Retry
+
+    class TimedCommandMixin:
+        """
+        명령 실행 시간을 Redis 지연 시간 메트릭과 요청별 "redis" 구간으로 기록
+        """
+        def execute_command(self, *args, **options):
+            start = time.perf_counter()
+            try:
+                return super().execute_command(*args, **options)
+            finally:
+                elapsed = time.perf_counter() - start
+                REDIS_LATENCY.labels(args[0]).observe(elapsed)
+                timing.record("redis", elapsed)
+
+    options = dict(
+        password=REDIS_PASSWORD,
+        decode_responses=True,  # 문자열 응답을 자동으로 디코딩
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        max_connections=REDIS_MAX_CONNECTIONS,
+    )
+
+    if is_cluster():
+        class TimedRedisCluster(TimedCommandMixin, RedisCluster):
+            pass
+
+        startup_nodes = []
+        for node in REDIS_CLUSTER_NODES.split(","):
+            host, _, port = node.strip().rpartition(":")
+            startup_nodes.append(ClusterNode(host, int(port)))
+
+        _client = TimedRedisCluster(startup_nodes=startup_nodes, **options)
+    else:
+        class TimedRedis(TimedCommandMixin, redis.Redis):
+            pass
+
+        _client = TimedRedis(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            db=REDIS_DB,
+            retry=Retry(NoBackoff(), 0),  # 재시도는 서킷 브레이커와 호출 측 정책에 맡김
+            **options,
+        )
+    return _client
+
+"""
+첫 속성 접근 시 실제 클라이언트를 생성해 위임하는 프록시
+기존처럼 `from ... import redis_client` 후 바로 사용할 수 있음
+"""
+class _LazyRedisClient:
+    def __getattr__(self, name):
+        return getattr(get_redis_client(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_redis_client(), name, value)
+
 # Redis 클라이언트
-redis_client = redis.Redis(
-    host=REDIS_HOST,
-    port=REDIS_PORT,
-    db=REDIS_DB,
-    password=REDIS_PASSWORD,
-    decode_responses=True  # 문자열 응답을 자동으로 디코딩
+redis_client = _LazyRedisClient()
+
+"""
+사용자별 키 생성: 해시 태그({user_id})로 한 사용자의 키가 클러스터의 같은 슬롯에 위치하도록 함
+(같은 사용자 키끼리의 파이프라인/다중 키 명령이 클러스터에서도 유효)
+"""
+def user_key(prefix: str, user_id) -> str:
+    return f"{prefix}{{{user_id}}}"
+
+"""
+패턴에 맞는 키 순회 (클러스터 모드에서는 모든 primary 노드를 순회)
+"""
+def scan_keys(pattern: str, count: int | None = None):
+    if is_cluster():
+        return redis_client.scan_iter(match=pattern, count=count, target_nodes="primaries")
+    return redis_client.scan_iter(match=pattern, count=count)
+
+"""
+서킷 브레이커가 장애로 셀 예외 (연결 실패, 타임아웃)
+WRONGTYPE 같은 명령 오류는 Redis가 정상 동작 중이므로 제외
+"""
+def is_redis_unavailable(exc: Exception) -> bool:
+    import redis
+
+    return isinstance(exc, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError))
+
+# Redis 서킷 브레이커 (TokenService 등에서 redis_breaker.call로 사용)
+redis_breaker = CircuitBreaker(
+    "redis",
+    is_redis_unavailable,
+    failure_threshold=REDIS_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=REDIS_BREAKER_RESET_TIMEOUT,
 )
 
-def init_redis(app: FastAPI):
-    """
-    FastAPI 앱에 Redis 클라이언트 연결
-    """
-    @app.on_event("startup")
-    async def startup_redis_client():
-        try:
-            # Redis 연결 테스트
-            redis_client.ping()
-            print("Redis connection established")
-        except redis.exceptions.ConnectionError:
-            print("Failed to connect to Redis")
-    
-    @app.on_event("shutdown")
-    async def shutdown_redis_client():
-        redis_client.close()
-        print("Redis connection closed")
\ No newline at end of file
+"""
+Redis 연결 테스트 (시작 시 헬스 체크)
+"""
+def check_redis() -> bool:
+    import redis
+
+    try:
+        redis_client.ping()
+        print("Redis connection established")
+        return True
+    except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+        print("Failed to connect to Redis")
+        return False
+
+def close_redis():
+    if _client is not None:
+        _client.close()
+        print("Redis connection closed")
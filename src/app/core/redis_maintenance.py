@@ -0,0 +1,140 @@
+"""
+Redis 키 공간 유지보수 작업
+
+- delete_keys: SCAN(COUNT 조절) + 파이프라인 UNLINK 배치로 패턴에 맞는 키를 삭제
+  (초당 삭제 키 수 제한으로 Redis 지연 급증 방지, 진행 상황 보고)
+- memory_usage_by_prefix: 키 접두사별 키 수와 메모리 사용량(MEMORY USAGE) 집계
+
+CLI 실행 예:
+    python -m src.app.core.redis_maintenance delete "blacklist:*" --count 1000 --batch-size 500 --rate 5000
+    python -m src.app.core.redis_maintenance memory --pattern "*" --top 20
+"""
+import argparse
+import sys
+import time
+
+from src.app.core.redis_config import redis_client, scan_keys
+
+DEFAULT_SCAN_COUNT = 1000  # SCAN 한 번에 검사할 키 수 (힌트)
+DEFAULT_BATCH_SIZE = 500  # 파이프라인 한 번에 보낼 명령 수
+PREFIX_SEPARATOR = ":"
+NO_PREFIX = "(no prefix)"
+
+def _batches(pattern: str, count: int, batch_size: int):
+    batch = []
+    for key in scan_keys(pattern, count=count):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+"""
+패턴에 맞는 키를 UNLINK 배치로 삭제 (UNLINK는 메모리 해제를 백그라운드 스레드에서 처리)
+max_keys_per_second: 초당 삭제 키 수 상한 (None이면 제한 없음)
+progress: 배치마다 progress(삭제한 키 수, 경과 시간) 호출
+반환값: 삭제한 키 수
+"""
+def delete_keys(
+    pattern: str,
+    count: int = DEFAULT_SCAN_COUNT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_keys_per_second: float | None = None,
+    progress=None,
+) -> int:
+    deleted = 0
+    started = time.monotonic()
+
+    for batch in _batches(pattern, count, batch_size):
+        pipe = redis_client.pipeline(transaction=False)
+        for key in batch:
+            pipe.unlink(key)
+        deleted += sum(pipe.execute())
+
+        elapsed = time.monotonic() - started
+        if max_keys_per_second:
+            # 지금까지 삭제한 키 수 기준으로 예산보다 앞서 있으면 대기
+            ahead = deleted / max_keys_per_second - elapsed
+            if ahead > 0:
+                time.sleep(ahead)
+                elapsed += ahead
+
+        if progress:
+            progress(deleted, elapsed)
+
+    return deleted
+
+"""
+키의 접두사 (첫 구분자까지, 예: "blacklist:", "refresh_tokens:")
+"""
+def key_prefix(key: str, separator: str = PREFIX_SEPARATOR) -> str:
+    head, found, _ = key.partition(separator)
+    return head + found if found else NO_PREFIX
+
+"""
+접두사별 키 수와 메모리 사용량(바이트) 집계, 메모리 사용량이 큰 순으로 반환
+samples: MEMORY USAGE의 중첩 값 샘플 수 (0이면 전체)
+"""
+def memory_usage_by_prefix(
+    pattern: str = "*",
+    count: int = DEFAULT_SCAN_COUNT,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    samples: int | None = None,
+    separator: str = PREFIX_SEPARATOR,
+) -> dict[str, dict]:
+    report: dict[str, dict] = {}
+
+    for batch in _batches(pattern, count, batch_size):
+        pipe = redis_client.pipeline(transaction=False)
+        for key in batch:
+            pipe.memory_usage(key, samples=samples)
+        for key, used in zip(batch, pipe.execute()):
+            # 순회 도중 만료/삭제된 키는 None
+            if used is None:
+                continue
+            entry = report.setdefault(key_prefix(key, separator), {"keys": 0, "bytes": 0})
+            entry["keys"] += 1
+            entry["bytes"] += used
+
+    return dict(sorted(report.items(), key=lambda item: item[1]["bytes"], reverse=True))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Redis 키 공간 유지보수")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    delete = commands.add_parser("delete", help="패턴에 맞는 키를 UNLINK 배치로 삭제")
+    delete.add_argument("pattern", help='삭제할 키 패턴 (예: "blacklist:*")')
+    delete.add_argument("--count", type=int, default=DEFAULT_SCAN_COUNT, help="SCAN COUNT")
+    delete.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="파이프라인 배치 크기")
+    delete.add_argument("--rate", type=float, default=None, help="초당 최대 삭제 키 수")
+
+    memory = commands.add_parser("memory", help="접두사별 메모리 사용량 보고")
+    memory.add_argument("--pattern", default="*", help="집계할 키 패턴")
+    memory.add_argument("--count", type=int, default=DEFAULT_SCAN_COUNT, help="SCAN COUNT")
+    memory.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="파이프라인 배치 크기")
+    memory.add_argument("--samples", type=int, default=None, help="MEMORY USAGE SAMPLES (0이면 전체)")
+    memory.add_argument("--top", type=int, default=20, help="출력할 접두사 수")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == "delete":
+        def report_progress(deleted: int, elapsed: float):
+            rate = deleted / elapsed if elapsed else 0.0
+            print(f"\r삭제 {deleted:,}개 ({elapsed:.1f}s, {rate:,.0f} keys/s)", end="", file=sys.stderr, flush=True)
+
+        deleted = delete_keys(args.pattern, args.count, args.batch_size, args.rate, report_progress)
+        print(file=sys.stderr)
+        print(f"{args.pattern}: {deleted:,}개 삭제")
+        return
+
+    report = memory_usage_by_prefix(args.pattern, args.count, args.batch_size, args.samples)
+    total = sum(entry["bytes"] for entry in report.values()) or 1
+    print(f"{'prefix':<30}{'keys':>12}{'bytes':>16}{'share':>8}")
+    for prefix, entry in list(report.items())[:args.top]:
+        print(f"{prefix:<30}{entry['keys']:>12,}{entry['bytes']:>16,}{entry['bytes'] / total:>8.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import os
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Server-Timing 응답 헤더 출력 여부 (내부 구간 시간이 노출되므로 기본값은 꺼짐, 개발/스테이징에서만 켬)
+SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "").lower() in ("1", "true", "yes", "on")
+# 구간별 소요 시간을 포함한 구조화된 접근 로그 출력 여부
+ACCESS_LOG_ENABLED = os.environ.get("ACCESS_LOG_ENABLED", "1").lower() in ("1", "true", "yes", "on")
+
+# 요청 단위 구간별 누적 시간 {구간명: [누적 초, 호출 횟수]}
+# 측정 중이 아닐 때는 None 이므로 계측 지점의 비용은 ContextVar 조회 한 번뿐
+_phases: ContextVar[dict | None] = ContextVar("request_phases", default=None)
+
+def is_enabled() -> bool:
+    return SERVER_TIMING_ENABLED or ACCESS_LOG_ENABLED
+
+"""
+현재 컨텍스트에서 구간 측정 중인지 여부
+"""
+def is_recording() -> bool:
+    return _phases.get() is not None
+
+"""
+현재 요청의 구간 측정을 시작하고 결과를 담을 dict를 반환
+"""
+def start_request() -> dict:
+    phases = {}
+    _phases.set(phases)
+    return phases
+
+"""
+현재 요청의 특정 구간에 소요 시간(초)을 누적
+"""
+def record(phase: str, elapsed: float):
+    phases = _phases.get()
+    if phases is None:
+        return
+
+    entry = phases.get(phase)
+    if entry is None:
+        phases[phase] = [elapsed, 1]
+    else:
+        entry[0] += elapsed
+        entry[1] += 1
+
+"""
+함수 실행 시간을 지정한 구간으로 기록하는 데코레이터
+"""
+def timed(phase: str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _phases.get() is None:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(phase, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+"""
+SQLAlchemy 엔진 이벤트로 쿼리 실행 시간을 "db" 구간에 기록
+"""
+def instrument_engine(engine: Engine):
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _phases.get() is not None:
+            conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("query_start", None)
+        if start is not None:
+            record("db", time.perf_counter() - start)
+
+"""
+Server-Timing 헤더 값 생성 (예: db;dur=1.2;desc="3 calls", total;dur=5.0)
+"""
+def format_server_timing(phases: dict, total: float) -> str:
+    metrics = [
+        f'{phase};dur={elapsed * 1000:.2f};desc="{count} calls"'
+        for phase, (elapsed, count) in phases.items()
+    ]
+    metrics.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(metrics)
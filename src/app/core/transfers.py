@@ -0,0 +1,77 @@
+"""
+파일 전송(첨부 파일 업로드/다운로드)용 스레드 제한
+
+전송은 청크마다 파일 읽기/쓰기를 스레드에서 실행하므로, 동시 전송이 많으면
+동기 엔드포인트가 쓰는 기본 스레드풀(THREADPOOL_SIZE) 토큰을 차지하게 됩니다.
+전송의 블로킹 작업은 별도 CapacityLimiter(TRANSFER_THREADS)로 실행해 기본 스레드풀과 분리합니다.
+"""
+import os
+
+import anyio
+from anyio.lowlevel import RunVar
+from fastapi.responses import FileResponse
+
+# 파일 전송의 블로킹 작업(읽기/쓰기/stat)에 쓰는 스레드 수
+TRANSFER_THREADS = int(os.environ.get("TRANSFER_THREADS", "8"))
+
+# 이벤트 루프별 제한 (anyio 기본 스레드풀 제한과 같은 방식)
+_transfer_limiter: RunVar[anyio.CapacityLimiter] = RunVar("transfer_limiter")
+
+"""
+파일 전송용 CapacityLimiter (이벤트 루프 안에서 호출)
+"""
+def get_transfer_limiter() -> anyio.CapacityLimiter:
+    try:
+        return _transfer_limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(TRANSFER_THREADS)
+        _transfer_limiter.set(limiter)
+        return limiter
+
+async def run_transfer_io(func, *args):
+    return await anyio.to_thread.run_sync(func, *args, limiter=get_transfer_limiter())
+
+"""
+파일 읽기를 전송용 스레드로 실행하는 FileResponse
+전체/단일 Range 응답만 직접 전송하고, 드문 다중 Range 응답은 FileResponse 기본 동작을 따름
+"""
+class TransferFileResponse(FileResponse):
+    async def __call__(self, scope, receive, send):
+        if self.stat_result is None:
+            try:
+                stat_result = await run_transfer_io(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            self.set_stat_headers(stat_result)
+            self.stat_result = stat_result
+        await super().__call__(scope, receive, send)
+
+    async def _send_file(self, send, start: int, end: int):
+        file = await run_transfer_io(open, self.path, "rb")
+        try:
+            if start:
+                await run_transfer_io(file.seek, start)
+            more_body = True
+            while more_body:
+                chunk = await run_transfer_io(file.read, min(self.chunk_size, end - start))
+                start += len(chunk)
+                more_body = len(chunk) > 0 and start < end
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        finally:
+            file.close()
+
+    async def _handle_simple(self, send, send_header_only: bool):
+        if send_header_only:
+            return await super()._handle_simple(send, send_header_only)
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await self._send_file(send, 0, self.stat_result.st_size)
+
+    async def _handle_single_range(self, send, start: int, end: int, file_size: int, send_header_only: bool):
+        if send_header_only:
+            return await super()._handle_single_range(send, start, end, file_size, send_header_only)
+
+        self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        self.headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+        await self._send_file(send, start, end)
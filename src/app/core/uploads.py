@@ -0,0 +1,187 @@
+"""
+multipart/form-data 업로드 스트리밍 수신
+
+요청 본문을 request.stream()으로 청크 단위로 읽어 지정한 필드의 파일만
+임시 파일에 바로 기록합니다 (본문 전체를 메모리나 Starlette 폼 파서의 임시 파일에 쌓지 않음).
+크기와 SHA-256은 기록하면서 함께 계산합니다.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import unicodedata
+from dataclasses import dataclass
+
+import anyio
+from fastapi import HTTPException, Request
+
+logger = logging.getLogger("app.uploads")
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+# Content-Length로 미리 거절할 때 파일 크기 외에 허용하는 multipart 경계/헤더 여유분 (바이트)
+MULTIPART_OVERHEAD = 64 * 1024
+
+"""
+업로드가 끝나 임시 파일로 저장된 파일
+"""
+@dataclass
+class ReceivedFile:
+    path: str
+    filename: str
+    content_type: str
+    size: int
+    sha256: str
+
+"""
+경로 구분자와 제어 문자를 제거한 파일 이름 (비어 있으면 "file")
+"""
+def clean_filename(filename: str) -> str:
+    name = filename.replace("\\", "/").rsplit("/", 1)[-1]
+    name = "".join(ch for ch in name if unicodedata.category(ch)[0] != "C").strip()
+    return name[:255] or "file"
+
+def remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("파일 삭제 실패 (%s): %s", path, e)
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"파일은 {max_size}바이트 이하여야 합니다."
+    )
+
+"""
+multipart 본문 파서
+field 파트의 내용만 청크 단위로 임시 파일에 기록 (다른 필드는 무시)
+"""
+class _MultipartFileWriter:
+    def __init__(self, boundary: bytes, field: str, directory: str, max_size: int):
+        from python_multipart.multipart import MultipartParser
+
+        self.field = field.encode()
+        self.directory = directory
+        self.max_size = max_size
+        self.parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+        self.file = None
+        self.received = None
+        self.hash = None
+        self.size = 0
+        self._writing = False
+        self._headers = {}
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        from python_multipart.multipart import parse_options_header
+
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        # 첫 번째 파일 파트만 저장
+        if options.get(b"name") != self.field or b"filename" not in options or self.file is not None:
+            return
+
+        content_type = self._headers.get(b"content-type", b"").decode("latin-1").strip()
+        self.hash = hashlib.sha256()
+        self.filename = clean_filename(options[b"filename"].decode("utf-8", "replace"))
+        self.content_type = content_type[:255] or DEFAULT_CONTENT_TYPE
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.file = tempfile.NamedTemporaryFile(dir=self.directory, delete=False)
+        self._writing = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if not self._writing:
+            return
+
+        self.size += end - start
+        if self.size > self.max_size:
+            raise _too_large(self.max_size)
+        chunk = data[start:end]
+        self.hash.update(chunk)
+        self.file.write(chunk)
+
+    def _on_part_end(self):
+        if not self._writing:
+            return
+
+        self._writing = False
+        self.file.close()
+        self.received = ReceivedFile(self.file.name, self.filename, self.content_type, self.size, self.hash.hexdigest())
+
+    def write(self, chunk: bytes):
+        self.parser.write(chunk)
+
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            remove_file(self.file.name)
+
+"""
+요청 본문(multipart/form-data)을 스트리밍으로 읽어 field 파일을 directory의 임시 파일로 저장
+파일 쓰기는 스레드에서 실행 (이벤트 루프를 막지 않음, limiter를 주지 않으면 기본 스레드풀)
+반환된 임시 파일은 호출 측에서 옮기거나 지워야 함
+python_multipart는 업로드 요청이 처음 들어올 때 불러옴 (앱 시작 시간에서 제외)
+"""
+async def receive_file(
+    request: Request,
+    field: str,
+    directory: str,
+    max_size: int,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> ReceivedFile:
+    from python_multipart.multipart import parse_options_header
+
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not options.get(b"boundary"):
+        raise HTTPException(
+            status_code=400,
+            detail="multipart/form-data 형식으로 업로드해주세요."
+        )
+
+    # 본문 크기를 알 수 있으면 읽기 전에 거절
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise _too_large(max_size)
+
+    writer = _MultipartFileWriter(options[b"boundary"], field, directory, max_size)
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await anyio.to_thread.run_sync(writer.write, chunk, limiter=limiter)
+        writer.parser.finalize()
+    except BaseException:
+        writer.discard()
+        raise
+
+    if writer.received is None:
+        writer.discard()
+        raise HTTPException(
+            status_code=400,
+            detail=f"'{field}' 필드로 파일을 업로드해주세요."
+        )
+    return writer.received
@@ -1,13 +1,27 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./sql_app.db" # TODO: 환경변수 처리하기
+from src.app.core import query_profiler
+from src.app.core.metrics import instrument_pool
+from src.app.core.timing import instrument_engine
+
+SQLALCHEMY_DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./sql_app.db")
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 쿼리 실행 시간을 요청별 "db" 구간으로 기록
+instrument_engine(engine)
+# 커넥션 풀 사용량을 메트릭으로 기록
+instrument_pool(engine)
+# 느린 쿼리 로그 및 쿼리 통계 (QUERY_PROFILER_ENABLED일 때만)
+query_profiler.instrument_engine(engine)
+
+# expire_on_commit=False: 커밋 후 속성 접근 시 불필요한 재조회(SELECT)가 발생하지 않도록 함
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
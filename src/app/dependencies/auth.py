@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from src.app.database import get_db
 from src.app.models.user import User
 from src.app.services.token_service import TokenService
+from src.app.services.user_import import BULK_IMPORT_ADMINS
 from src.app.utils.auth import verify_token
 
 # OAuth2 인증 체계 설정 (토큰 URL 지정)
@@ -57,4 +58,16 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     # 토큰 정보를 사용자 객체에 추가 (로그아웃을 위해)
     user.token = token
     
-    return user
\ No newline at end of file
+    return user
+
+"""
+사용자 일괄 등록 권한 확인 (BULK_IMPORT_ADMINS에 있는 사용자만 가능)
+"""
+def get_bulk_import_admin(current_user: User = Depends(get_current_user)):
+    if current_user.username not in BULK_IMPORT_ADMINS:
+        raise HTTPException(
+            status_code=403,
+            detail="사용자 일괄 등록 권한이 없습니다.",
+        )
+
+    return current_user
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, func
+
+from src.app.database import Base
+
+
+"""
+게시글 첨부 파일 메타데이터
+파일 내용은 DB에 저장하지 않고 ATTACHMENT_DIR 아래 storage_key 경로의 파일로 보관
+"""
+class Attachment(Base):
+    __tablename__ = "attachments"
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String, nullable=False)  # 업로드 시 파일 이름 (다운로드 시 Content-Disposition에 사용)
+    content_type = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False)  # 내용 해시 (다운로드 ETag)
+    storage_key = Column(String, nullable=False, unique=True)  # ATTACHMENT_DIR 기준 상대 경로
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
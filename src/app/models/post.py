@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from src.app.database import Base
@@ -6,14 +6,24 @@ from src.app.database import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 작성자별 최신순 목록 (키셋 페이지네이션)
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+        # 전체 최신순 목록
+        Index("ix_posts_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     author = Column(String)
     title = Column(String, index=True)
     content = Column(String)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 낙관적 동시성 제어용 버전 (수정될 때마다 1씩 증가, ETag/If-Match에 사용)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # 조회수 (읽기 경로에서는 메모리에 모았다가 주기적으로 한 번에 반영, 버전과 무관)
+    views = Column(Integer, nullable=False, default=0, server_default="0")
 
     # 관계설정
     author_id = Column(Integer, ForeignKey("users.id"))
-    author = relationship("User", back_populates="posts")
+    user = relationship("User", back_populates="posts")
 
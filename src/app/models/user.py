@@ -13,6 +13,8 @@ class User(Base):
     username = Column(String, unique=True, index=True)
     password = Column(String)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 작성한 게시글 수 (게시글 생성/삭제 시 같은 트랜잭션에서 증감, COUNT(*) 대신 사용)
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
 
-    # 관계설정
-    posts = relationship("Post", back_populates="author")
\ No newline at end of file
+    # 관계설정 (게시글 전체를 한 번에 불러오지 않도록 write_only, 목록은 PostService.get_user_posts 사용)
+    posts = relationship("Post", back_populates="user", lazy="write_only")
\ No newline at end of file
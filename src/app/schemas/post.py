@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import List
 from pydantic import BaseModel
 
 
@@ -19,4 +20,26 @@ class PostResponse(BaseModel):
     created_at: datetime
     
     class Config:
-        from_attributes = True # SQLAlchemy 모델을 Pydantic 모델로 변환할 때 필요
\ No newline at end of file
+        from_attributes = True # SQLAlchemy 모델을 Pydantic 모델로 변환할 때 필요
+
+class PostStatsResponse(BaseModel):
+    post_id: int
+    views: int  # 누적 조회수 (다른 워커의 최근 몇 초 분은 반영 전일 수 있음)
+    unique_viewers: int | None  # 순 방문자 수 근사치 (HyperLogLog), Redis 장애 시 null
+
+class UserPostsResponse(BaseModel):
+    items: List[PostResponse]
+    next_cursor: str | None  # 다음 페이지 커서 (마지막 페이지면 null)
+    total: int  # 작성자의 전체 게시글 수 (users.post_count)
+
+class AttachmentResponse(BaseModel):
+    id: int
+    post_id: int
+    filename: str
+    content_type: str
+    size: int  # 바이트
+    sha256: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -13,4 +13,8 @@ class UserResponse(UserBase):
     created_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class UserAvailabilityResponse(BaseModel):
+    email: bool | None = None  # 사용 가능 여부 (요청하지 않은 항목은 null)
+    username: bool | None = None
@@ -0,0 +1,146 @@
+import os
+import uuid
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.orm import Session
+
+from src.app.core.transfers import get_transfer_limiter
+from src.app.core.uploads import ReceivedFile, receive_file, remove_file
+from src.app.database import get_db
+from src.app.models.attachment import Attachment
+from src.app.models.post import Post
+from src.app.models.user import User
+
+ATTACHMENT_DIR = os.path.abspath(os.environ.get("ATTACHMENT_DIR", "./attachments"))  # 첨부 파일 저장 위치
+ATTACHMENT_MAX_SIZE = int(os.environ.get("ATTACHMENT_MAX_SIZE", str(10 * 1024 * 1024)))  # 파일 하나의 최대 크기 (바이트)
+ATTACHMENT_FIELD = "file"  # multipart 본문에서 파일을 읽을 필드 이름
+
+# 업로드 중인 파일은 같은 파일 시스템의 임시 디렉터리에 쓰고 완료 후 rename
+_TMP_DIR = os.path.join(ATTACHMENT_DIR, "tmp")
+
+def attachment_path(storage_key: str) -> str:
+    return os.path.join(ATTACHMENT_DIR, storage_key)
+
+"""
+삭제된 첨부 파일(들)의 실제 파일 제거 (DB 커밋 후 호출)
+"""
+def remove_files(storage_keys: list[str]):
+    for storage_key in storage_keys:
+        remove_file(attachment_path(storage_key))
+
+"""
+요청 본문에서 ATTACHMENT_FIELD 파일을 스트리밍으로 받아 임시 파일로 저장 (파일 쓰기는 전송용 스레드에서)
+"""
+async def receive_attachment(request: Request) -> ReceivedFile:
+    return await receive_file(request, ATTACHMENT_FIELD, _TMP_DIR, ATTACHMENT_MAX_SIZE, get_transfer_limiter())
+
+class AttachmentService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    """
+    첨부 파일을 추가할 수 있는지 확인 (게시글 작성자만 가능, 아니면 404)
+    """
+    def check_post_owner(self, post_id: int, user: User):
+        query = (
+            select(Post.id).
+            where(Post.id == post_id, Post.author_id == user.id)
+        )
+        if self.db.execute(query).scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+
+    """
+    임시 파일을 저장 위치로 옮기고 메타데이터 저장
+    업로드 중에 게시글이 삭제됐을 수 있으므로 INSERT ... SELECT ... WHERE EXISTS로
+    게시글(작성자 포함)이 남아 있을 때만 저장하고, 저장되지 않았거나 실패하면 옮긴 파일을 지움
+    """
+    def create_attachment(self, post_id: int, received: ReceivedFile, user: User):
+        storage_key = uuid.uuid4().hex
+        storage_key = f"{storage_key[:2]}/{storage_key}"
+        path = attachment_path(storage_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(received.path, path)
+
+        post_exists = (
+            select(Post.id).
+            where(Post.id == post_id, Post.author_id == user.id).
+            exists()
+        )
+        values = select(
+            literal(post_id),
+            literal(received.filename),
+            literal(received.content_type),
+            literal(received.size),
+            literal(received.sha256),
+            literal(storage_key),
+        ).where(post_exists)
+        query = (
+            insert(Attachment).
+            from_select(
+                ["post_id", "filename", "content_type", "size", "sha256", "storage_key"],
+                values,
+            ).
+            returning(Attachment)
+        )
+        try:
+            attachment = self.db.execute(query).scalar_one_or_none()
+            if attachment is None:
+                self.db.rollback()
+                remove_file(path)
+                raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
+            self.db.commit()
+        except HTTPException:
+            raise
+        except Exception:
+            self.db.rollback()
+            remove_file(path)
+            raise
+
+        return attachment
+
+    """
+    게시글의 첨부 파일 목록 (메타데이터만)
+    """
+    def get_attachments(self, post_id: int):
+        query = (
+            select(Attachment).
+            where(Attachment.post_id == post_id).
+            order_by(Attachment.id)
+        )
+        return self.db.execute(query).scalars().all()
+
+    def get_attachment(self, post_id: int, attachment_id: int):
+        query = (
+            select(Attachment).
+            where(Attachment.id == attachment_id, Attachment.post_id == post_id)
+        )
+        return self.db.execute(query).scalar_one_or_none()
+
+    """
+    첨부 파일 삭제 (게시글 작성자만 가능)
+    메타데이터를 먼저 지우고 커밋한 뒤 파일 제거
+    """
+    def delete_attachment(self, post_id: int, attachment_id: int, user: User):
+        query = (
+            delete(Attachment).
+            where(
+                Attachment.id == attachment_id,
+                Attachment.post_id == post_id,
+                Attachment.post_id.in_(select(Post.id).where(Post.author_id == user.id)),
+            ).
+            returning(Attachment.storage_key)
+        )
+        storage_key = self.db.execute(query).scalar_one_or_none()
+
+        if storage_key is None:
+            self.db.rollback()
+            return False
+
+        self.db.commit()
+        remove_files([storage_key])
+
+        return True
+
+def get_attachment_service(db: Session = Depends(get_db)):
+    return AttachmentService(db)
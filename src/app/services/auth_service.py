@@ -8,7 +8,7 @@ from src.app.database import get_db
 from src.app.models.user import User
 from src.app.schemas.auth import LoginRequest
 from src.app.services.token_service import TokenService
-from src.app.utils.security import verify_password
+from src.app.utils.security import get_password_hash, password_needs_update, verify_password
 from src.app.utils.auth import create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, create_refresh_token, verify_token
 
 class AuthService:
@@ -29,6 +29,11 @@ class AuthService:
         # 사용자가 존재하지 않거나 비밀번호가 일치하지 않는 경우
         if not user or not verify_password(login_data.password, user.password):
             return None
+
+        # 이전 비용(BCRYPT_ROUNDS 변경 전)으로 저장된 비밀번호는 현재 비용으로 다시 해시
+        if password_needs_update(user.password):
+            user.password = get_password_hash(login_data.password)
+            self.db.commit()
     
         return user
     
@@ -89,7 +94,7 @@ class AuthService:
             
         # 사용자 조회
         user = self.db.query(User).filter(User.username == username).first()
-        if not user or not user.is_active:
+        if not user:
             return None
             
         # 토큰에 포함될 데이터
@@ -0,0 +1,159 @@
+import logging
+import threading
+import time
+
+from src.app.core.redis_config import redis_client, scan_keys
+
+logger = logging.getLogger("app.blacklist")
+
+# 구독 루프가 이 시간(초) 이상 갱신되지 않으면 로컬 사본을 신뢰하지 않고 Redis를 직접 조회
+MAX_STALENESS = 3.0
+# 발행 시각 대비 수신 지연이 이 시간(초)을 넘으면 따라잡을 때까지 Redis를 직접 조회
+MAX_LAG = 1.0
+# 만료된 항목 정리 주기 (초)
+SWEEP_INTERVAL = 30.0
+# 구독 연결로 PING을 보내는 주기 (초), PONG을 받아야만 동기화된 것으로 간주하므로 MAX_STALENESS보다 짧아야 함
+PING_INTERVAL = 1.0
+# 구독 연결이 끊겼을 때 재연결 대기 시간 (초)
+RECONNECT_DELAY = 1.0
+
+# 전체 초기화 메시지
+CLEAR_MESSAGE = "*"
+
+"""
+워커별 토큰 블랙리스트 로컬 사본
+
+시작 시 Redis의 블랙리스트를 읽어 오고, 이후 blacklist_token이 발행하는
+pub/sub 메시지로 갱신합니다. 각 항목은 토큰 만료 시각에 제거됩니다.
+구독이 끊겼거나 지연되는 동안에는 is_fresh()가 False가 되어 Redis 조회로 대체합니다.
+"""
+class BlacklistMirror:
+    def __init__(self, key_prefix: str, channel: str):
+        self.key_prefix = key_prefix
+        self.channel = channel
+        self._entries: dict[str, float] = {}  # 토큰 -> 만료 시각(epoch)
+        self._synced_at = float("-inf")  # 구독 연결이 살아 있음을 마지막으로 확인한 시각 (PONG/메시지 수신, monotonic)
+        self._lagging = False
+        self._stop = threading.Event()
+        self._thread = None
+
+    """
+    발행 메시지 형식: "<발행 시각>:<만료 시각>:<토큰>"
+    """
+    def format_message(self, token: str, expires_in: int) -> str:
+        now = time.time()
+        return f"{now}:{now + expires_in}:{token}"
+
+    def is_fresh(self) -> bool:
+        return not self._lagging and time.monotonic() - self._synced_at < MAX_STALENESS
+
+    def contains(self, token: str) -> bool:
+        expires_at = self._entries.get(token)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            self._entries.pop(token, None)
+            return False
+        return True
+
+    def add(self, token: str, expires_at: float):
+        self._entries[token] = expires_at
+
+    def clear(self):
+        self._entries.clear()
+
+    def _apply(self, data: str):
+        if data == CLEAR_MESSAGE:
+            self.clear()
+            return
+
+        published_at, expires_at, token = data.split(":", 2)
+        self.add(token, float(expires_at))
+        self._lagging = time.time() - float(published_at) > MAX_LAG
+
+    def _sweep(self):
+        now = time.time()
+        for token, expires_at in list(self._entries.items()):
+            if expires_at <= now:
+                self._entries.pop(token, None)
+
+    """
+    Redis의 현재 블랙리스트 전체를 읽어 로컬 사본을 교체
+    """
+    def _load(self):
+        entries = {}
+        now = time.time()
+        prefix_length = len(self.key_prefix)
+
+        keys = list(scan_keys(f"{self.key_prefix}*", count=1000))
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            pipe = redis_client.pipeline(transaction=False)
+            for key in batch:
+                pipe.pttl(key)
+            for key, ttl in zip(batch, pipe.execute()):
+                if ttl > 0:
+                    entries[key[prefix_length:]] = now + ttl / 1000
+
+        self._entries = entries
+        logger.info("블랙리스트 로컬 사본 로드: %d개", len(entries))
+
+    def _run(self):
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                # 구독 확인/PONG 응답도 연결이 살아 있다는 증거로 쓰기 위해 모두 받음
+                pubsub = redis_client.pubsub()
+                pubsub.subscribe(self.channel)
+                # 구독 후에 로드해야 그 사이에 추가된 항목을 놓치지 않음
+                self._load()
+                self._lagging = False
+                connected_at = last_sweep = time.monotonic()
+                last_ping = float("-inf")
+
+                while not self._stop.is_set():
+                    now = time.monotonic()
+                    # 오류 없이 구독이 끊긴 경우(half-open TCP, 장애 조치)를 감지하도록
+                    # 주기적으로 PING을 보내고 PONG을 받았을 때만 동기화 시각 갱신
+                    if now - max(self._synced_at, connected_at) > MAX_STALENESS:
+                        raise ConnectionError(f"{MAX_STALENESS}초 동안 구독 연결 응답 없음")
+                    if now - last_ping >= PING_INTERVAL:
+                        pubsub.ping()
+                        last_ping = now
+
+                    message = pubsub.get_message(timeout=PING_INTERVAL)
+                    if message is None:
+                        # 대기 중인 메시지를 모두 처리했으므로 지연 해소
+                        self._lagging = False
+                    else:
+                        self._synced_at = time.monotonic()
+                        if message["type"] == "message":
+                            self._apply(message["data"])
+
+                    if now - last_sweep > SWEEP_INTERVAL:
+                        self._sweep()
+                        last_sweep = now
+            except Exception as e:
+                self._synced_at = float("-inf")
+                logger.warning("블랙리스트 구독 끊김, 재연결 시도: %s", e)
+                self._stop.wait(RECONNECT_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="blacklist-mirror", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._synced_at = float("-inf")
@@ -0,0 +1,148 @@
+import logging
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from src.app.core.circuit_breaker import DependencyUnavailableError
+from src.app.core.metrics import record_cache
+from src.app.core.redis_config import redis_breaker, redis_client
+from src.app.models.post import Post
+from src.app.schemas.post import PostResponse
+
+logger = logging.getLogger("app.post_feed")
+
+# 최신 게시글 피드 (sorted set: 점수 = 게시글 ID, 값 = 직렬화된 게시글)
+# created_at은 INSERT 시 DB가 채우고 바뀌지 않으므로 ID 역순이 목록 API의 최신순(created_at, id 역순)과 같음
+# 두 키를 한 스크립트에서 다루므로 해시 태그로 같은 슬롯에 둠
+FEED_KEY = "feed:{latest}"
+FEED_VERSION_KEY = "feed:{latest}:version"  # 쓰기마다 증가, 재구성 중 쓰기가 있었는지 확인
+FEED_SIZE = 100  # 피드에 보관할 게시글 수 (첫 페이지 최대 크기)
+FEED_PAGE_SIZE = 20  # 기본 페이지 크기
+FEED_TTL = 300  # 피드 유지 시간 (초), Redis 장애로 놓친 갱신이 있어도 이 시간 안에 재구성됨
+
+# 피드가 존재함(비어 있어도)을 표시하는 항목 (점수 0, 게시글 ID는 1부터)
+FEED_SENTINEL = ""
+
+# 새 게시글 추가 (피드가 있을 때만), 오래된 게시글은 FEED_SIZE개만 남기고 제거 (0번 순위는 표시 항목)
+_ADD_SCRIPT = """
+redis.call('INCR', KEYS[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+redis.call('ZREMRANGEBYRANK', KEYS[1], 1, -(tonumber(ARGV[3]) + 1))
+return 1
+"""
+
+# 피드에 있는 게시글만 교체
+_REPLACE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+if redis.call('ZREMRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+return 1
+"""
+
+# 피드에 있는 게시글이 삭제되면 피드를 지워 다음 조회 때 DB에서 다시 채움
+_REMOVE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+if redis.call('ZREMRANGEBYSCORE', KEYS[1], ARGV[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+# DB에서 읽은 게시글로 피드 교체 (읽는 동안 다른 쓰기가 없었을 때만)
+_REBUILD_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZADD', KEYS[1], 0, ARGV[3])
+for i = 4, #ARGV, 2 do
+    redis.call('ZADD', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+_scripts = {}
+
+# 피드 응답을 목록 API의 응답 모델과 같은 스키마로 검증/직렬화 (예전 형식으로 저장된 항목이 그대로 나가지 않도록)
+_response_adapter = TypeAdapter(List[PostResponse])
+
+def _script(source: str):
+    if source not in _scripts:
+        _scripts[source] = redis_client.register_script(source)
+    return _scripts[source]
+
+def _serialize(post: Post) -> str:
+    return PostResponse.model_validate(post).model_dump_json()
+
+"""
+Redis 작업 실행, 장애 시 None (피드는 TTL 안에 재구성되므로 쓰기 실패는 무시)
+"""
+def _call(func, *args):
+    try:
+        return redis_breaker.call(func, *args)
+    except DependencyUnavailableError as e:
+        logger.warning("피드 갱신/조회 실패: %s", e)
+        return None
+
+def add(post: Post):
+    _call(lambda: _script(_ADD_SCRIPT)(keys=[FEED_KEY, FEED_VERSION_KEY], args=[post.id, _serialize(post), FEED_SIZE]))
+
+def replace(post: Post):
+    _call(lambda: _script(_REPLACE_SCRIPT)(keys=[FEED_KEY, FEED_VERSION_KEY], args=[post.id, _serialize(post)]))
+
+def remove(post_id: int):
+    _call(lambda: _script(_REMOVE_SCRIPT)(keys=[FEED_KEY, FEED_VERSION_KEY], args=[post_id]))
+
+"""
+최신 게시글 size개를 직렬화된 JSON 문자열 목록으로 반환 (Redis 한 번 조회, SQL 없음)
+피드가 없으면 DB에서 다시 채우고, Redis 장애 시에는 None (호출 측에서 DB 조회)
+"""
+def latest(db, size: int) -> list[str] | None:
+    members = _call(redis_client.zrevrange, FEED_KEY, 0, size)
+    if members:
+        record_cache("post_feed", True)
+        return [member for member in members if member != FEED_SENTINEL][:size]
+
+    record_cache("post_feed", False)
+    if members is None:
+        return None
+    return rebuild(db)[:size]
+
+"""
+DB에서 최신 게시글 FEED_SIZE개를 읽어 피드를 다시 만듦
+읽는 동안 다른 쓰기가 있었으면 피드는 그대로 두고 읽은 결과만 반환
+"""
+def rebuild(db) -> list[str]:
+    version = _call(redis_client.get, FEED_VERSION_KEY) or ""
+
+    query = (
+        select(Post).
+        order_by(Post.created_at.desc(), Post.id.desc()).
+        limit(FEED_SIZE)
+    )
+    posts = db.execute(query).scalars().all()
+    members = [_serialize(post) for post in posts]
+
+    args = [version, FEED_TTL, FEED_SENTINEL]
+    for post, member in zip(posts, members):
+        args.extend([post.id, member])
+    _call(lambda: _script(_REBUILD_SCRIPT)(keys=[FEED_KEY, FEED_VERSION_KEY], args=args))
+
+    return members
+
+def to_json_array(members: list[str]) -> str:
+    return "[" + ",".join(members) + "]"
+
+"""
+피드 항목을 List[PostResponse] 응답 본문(JSON 바이트)으로 변환
+"""
+def to_response_json(members: list[str]) -> bytes:
+    return _response_adapter.dump_json(_response_adapter.validate_json(to_json_array(members)))
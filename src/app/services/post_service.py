@@ -1,11 +1,43 @@
-from fastapi import Depends
-from sqlalchemy import select
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import String, delete, func, literal, select, tuple_, type_coerce, update
 from sqlalchemy.orm import Session
 
 from src.app.database import get_db
+from src.app.models.attachment import Attachment
 from src.app.models.post import Post
 from src.app.models.user import User
 from src.app.schemas.post import PostCreate, PostUpdate
+from src.app.services import attachment_service, post_feed, view_counter
+
+USER_POSTS_PAGE_SIZE = 20  # 작성자별 게시글 목록 기본 페이지 크기
+
+# DB에 저장된 그대로의 created_at 문자열
+# (server_default로 채운 "YYYY-MM-DD HH:MM:SS"와 SQLAlchemy가 넣는 ".ffffff" 형식이 섞여 있으므로
+#  datetime으로 바꿔 비교하지 않고 저장된 문자열끼리 비교, 컬럼에 함수를 씌우지 않아 인덱스는 그대로 사용)
+_stored_created_at = type_coerce(Post.created_at, String)
+
+"""
+다음 페이지 커서: 마지막 게시글의 "id|저장된 created_at"을 URL-safe base64로 인코딩
+"""
+def encode_cursor(post_id: int, created_at: str) -> str:
+    raw = f"{post_id}|{created_at}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[int, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        post_id, created_at = raw.split("|", 1)
+        datetime.fromisoformat(created_at)
+        return int(post_id), created_at
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=400,
+            detail="잘못된 커서입니다."
+        )
 
 class PostService:
     def __init__(self, db: Session):
@@ -14,22 +46,43 @@ class PostService:
     게시글 생성
     """
     def create_post(self, post: PostCreate, user: User):
-        created_post = Post(**post.model_dump())
+        created_post = Post(**post.model_dump(), author_id=user.id)
 
         self.db.add(created_post)
+        # 작성자 게시글 수는 같은 트랜잭션에서 증가
+        self.db.execute(
+            update(User).
+            where(User.id == user.id).
+            values(post_count=User.post_count + 1)
+        )
         self.db.commit()
         self.db.refresh(created_post)
 
+        post_feed.add(created_post)
+
         return created_post
 
     """
-    전체 게시글 목록 조회
+    첫 페이지 게시글 목록 (Redis 최신 게시글 피드, List[PostResponse] JSON 바이트)
+    Redis를 사용할 수 없으면 None
     """
-    def get_posts(self):
+    def get_feed(self, size: int):
+        members = post_feed.latest(self.db, size)
+        if members is None:
+            return None
+        return post_feed.to_response_json(members)
+
+    """
+    게시글 목록 조회 (최신순, page는 1부터)
+    작성 시각이 같으면 ID 역순, (created_at, id) 인덱스를 따라 읽음
+    """
+    def get_posts(self, page: int = 1, size: int = post_feed.FEED_PAGE_SIZE):
         """방법1"""
         query = (
             select(Post).
-            order_by(Post.created_at.desc())
+            order_by(Post.created_at.desc(), Post.id.desc()).
+            offset((page - 1) * size).
+            limit(size)
         )
         posts = self.db.execute(query).scalars().all()
         """방법2(sqlalchemy 2.0에서 deprecated)"""
@@ -37,6 +90,45 @@ class PostService:
 
         return posts
     
+    """
+    작성자별 게시글 목록 (최신순, 키셋 페이지네이션)
+    (author_id, created_at, id) 인덱스를 따라 limit + 1개만 읽으므로 작성자의 게시글 수와 무관하게 일정한 비용
+    전체 개수는 COUNT(*) 대신 users.post_count 사용, 사용자가 없으면 None
+    """
+    def get_user_posts(self, user_id: int, limit: int = USER_POSTS_PAGE_SIZE, cursor: str | None = None):
+        total = self.db.execute(
+            select(User.post_count).
+            where(User.id == user_id)
+        ).scalar_one_or_none()
+        if total is None:
+            return None
+
+        query = (
+            select(Post, _stored_created_at.label("stored_created_at")).
+            where(Post.author_id == user_id).
+            order_by(Post.created_at.desc(), Post.id.desc()).
+            limit(limit + 1)
+        )
+        if cursor is not None:
+            cursor_id, cursor_created_at = decode_cursor(cursor)
+            # 커서 게시글이 남아 있으면 저장된 값을 다시 읽고(이전 형식 커서 호환), 삭제됐으면 커서의 값 사용
+            created_at = func.coalesce(
+                select(_stored_created_at).where(Post.id == cursor_id).scalar_subquery(),
+                literal(cursor_created_at, String),
+            )
+            query = query.where(tuple_(_stored_created_at, Post.id) < tuple_(created_at, cursor_id))
+
+        rows = self.db.execute(query).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_post, last_created_at = rows[-1]
+            next_cursor = encode_cursor(last_post.id, last_created_at)
+        posts = [post for post, _ in rows]
+
+        return {"items": posts, "next_cursor": next_cursor, "total": total}
+
     """
     특정 게시글 조회
     """
@@ -53,59 +145,120 @@ class PostService:
         return post
     
     """
-    게시글 수정
-    작성자만 수정 가능
+    게시글 조회 기록 (메모리 카운터만 증가, DB 반영은 백그라운드에서 주기적으로)
     """
-    def update_post(self, post_id: int, post_update: PostUpdate, user: User):
+    def record_view(self, post_id: int, viewer: str):
+        if view_counter.VIEW_COUNTER_ENABLED:
+            view_counter.view_counter.record(post_id, viewer)
+
+    """
+    게시글 조회수/순 방문자 수 (게시글이 없으면 None)
+    """
+    def get_post_stats(self, post_id: int):
         query = (
-            select(Post).
+            select(Post.views).
             where(Post.id == post_id)
         )
-        post = self.db.execute(query).scalar_one_or_none()
-
-        if post is None:
+        views = self.db.execute(query).scalar_one_or_none()
+        if views is None:
             return None
-        
-        # 작성자 확인
-        if post.author_id != user.id:
-            return None
-        
+
+        return {
+            "post_id": post_id,
+            "views": views + view_counter.view_counter.pending(post_id),
+            "unique_viewers": view_counter.unique_viewers(post_id),
+        }
+
+    """
+    게시글 수정
+    작성자만 수정 가능
+    UPDATE ... WHERE id AND author_id RETURNING 단일 쿼리로 소유자 확인과 수정을 함께 처리
+    expected_version이 주어지면 해당 버전일 때만 수정 (If-Match)
+    """
+    def update_post(self, post_id: int, post_update: PostUpdate, user: User, expected_version: int | None = None):
         update_dict = {
             key: value
             for key, value in post_update.model_dump().items()
             if value is not None
         }
 
-        for key, value in update_dict.items():
-            setattr(post, key, value)
+        query = (
+            update(Post).
+            where(Post.id == post_id, Post.author_id == user.id).
+            values(**update_dict, version=Post.version + 1).
+            returning(Post)
+        )
+        if expected_version is not None:
+            query = query.where(Post.version == expected_version)
+
+        post = self.db.execute(query).scalar_one_or_none()
+
+        if post is None:
+            self.db.rollback()
+            self._raise_if_version_mismatch(post_id, user, expected_version)
+            return None
 
         self.db.commit()
-        self.db.refresh(post)
+
+        post_feed.replace(post)
 
         return post
     
     """
     게시글 삭제
     작성자만 삭제 가능
+    DELETE ... WHERE id AND author_id 단일 쿼리로 처리하고 rowcount로 성공 여부 판단
     """
-    def delete_post(self, post_id: int, user: User):
+    def delete_post(self, post_id: int, user: User, expected_version: int | None = None):
         query = (
-            select(Post).
-            where(Post.id == post_id)
+            delete(Post).
+            where(Post.id == post_id, Post.author_id == user.id)
         )
-        post = self.db.execute(query).scalar_one_or_none()
+        if expected_version is not None:
+            query = query.where(Post.version == expected_version)
 
-        if post is None:
-            return False
-        
-        # 작성자 확인
-        if post.author_id != user.id:
+        result = self.db.execute(query)
+
+        if result.rowcount == 0:
+            self.db.rollback()
+            self._raise_if_version_mismatch(post_id, user, expected_version)
             return False
 
-        self.db.delete(post)
+        self.db.execute(
+            update(User).
+            where(User.id == user.id).
+            values(post_count=User.post_count - 1)
+        )
+        # 첨부 파일 메타데이터도 같은 트랜잭션에서 삭제하고, 파일은 커밋 후 제거
+        storage_keys = self.db.execute(
+            delete(Attachment).
+            where(Attachment.post_id == post_id).
+            returning(Attachment.storage_key)
+        ).scalars().all()
         self.db.commit()
 
+        attachment_service.remove_files(storage_keys)
+        post_feed.remove(post_id)
+        view_counter.forget(post_id)
+
         return True
+
+    """
+    수정/삭제 실패 시에만 호출되어 버전 불일치(412)와 게시글 없음(404)을 구분
+    """
+    def _raise_if_version_mismatch(self, post_id: int, user: User, expected_version: int | None):
+        if expected_version is None:
+            return
+
+        query = (
+            select(Post.id).
+            where(Post.id == post_id, Post.author_id == user.id)
+        )
+        if self.db.execute(query).scalar_one_or_none() is not None:
+            raise HTTPException(
+                status_code=412,
+                detail="게시글이 다른 요청에 의해 변경되었습니다."
+            )
     
 def get_post_service(db: Session = Depends(get_db)):
     return PostService(db)
\ No newline at end of file
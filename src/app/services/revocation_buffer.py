@@ -0,0 +1,157 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from src.app.core.metrics import REVOCATIONS_BUFFERED, REVOCATIONS_REPLAYED
+
+logger = logging.getLogger("app.revocation_buffer")
+
+# Redis 장애 중 발생한 토큰 폐기 기록을 보관할 로컬 디렉터리 (워커 간 공유)
+REVOCATION_BUFFER_DIR = os.environ.get(
+    "REVOCATION_BUFFER_DIR", os.path.join(tempfile.gettempdir(), "revocation-buffer")
+)
+# 보관된 기록이 있는지 확인해 재적용하는 주기 (초)
+REVOCATION_REPLAY_INTERVAL = 1.0
+
+"""
+Redis에 기록하지 못한 토큰 폐기(로그아웃)를 로컬 파일에 먼저 남겨 두고(write-ahead),
+Redis가 복구되면 순서대로 다시 적용하는 버퍼
+
+워커마다 자기 pid 파일에 추가하고, 재적용 시에는 디렉터리의 모든 파일을
+이름 변경으로 선점하므로 종료된 워커가 남긴 기록도 다른 워커가 처리함
+"""
+class RevocationBuffer:
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._replaying = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def _path(self) -> str:
+        return os.path.join(self.directory, f"revocations-{os.getpid()}.jsonl")
+
+    def _write(self, records: list[dict]):
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, record: dict):
+        self._write([record])
+        REVOCATIONS_BUFFERED.inc()
+
+    """
+    재적용 대상 파일인지 확인 (재적용 도중 종료된 워커가 선점해 둔 파일 포함)
+    """
+    @staticmethod
+    def _is_claimable(name: str) -> bool:
+        if name.endswith(".jsonl"):
+            return True
+
+        _, marker, pid = name.partition(".jsonl.replaying-")
+        if not marker or not pid.isdigit():
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+    def has_pending(self) -> bool:
+        try:
+            return any(self._is_claimable(name) for name in os.listdir(self.directory))
+        except FileNotFoundError:
+            return False
+
+    """
+    보관된 기록을 apply(record)로 재적용
+    apply가 실패하면 남은 기록을 다시 보관하고 중단
+    반환값: 재적용한 기록 수
+    """
+    def replay(self, apply) -> int:
+        if not self._replaying.acquire(blocking=False):
+            return 0
+
+        applied = 0
+        try:
+            for name in sorted(os.listdir(self.directory)):
+                if not self._is_claimable(name):
+                    continue
+
+                # 다른 워커와 동시에 같은 파일을 처리하지 않도록 이름 변경으로 선점
+                source = os.path.join(self.directory, name)
+                claimed = f"{source.partition('.replaying-')[0]}.replaying-{os.getpid()}"
+                with self._lock:
+                    try:
+                        os.rename(source, claimed)
+                    except FileNotFoundError:
+                        continue
+
+                with open(claimed, encoding="utf-8") as f:
+                    records = [json.loads(line) for line in f if line.strip()]
+
+                for index, record in enumerate(records):
+                    try:
+                        apply(record)
+                    except Exception as e:
+                        logger.warning("토큰 폐기 재적용 중단 (%d건 남음): %s", len(records) - index, e)
+                        self._write(records[index:])
+                        os.remove(claimed)
+                        return applied
+                    applied += 1
+                    REVOCATIONS_REPLAYED.inc()
+
+                os.remove(claimed)
+        except FileNotFoundError:
+            pass
+        finally:
+            self._replaying.release()
+
+        if applied:
+            logger.info("보관된 토큰 폐기 %d건 재적용", applied)
+        return applied
+
+    """
+    백그라운드 스레드에서 재적용 (요청 처리 스레드를 막지 않도록)
+    """
+    def replay_in_background(self, apply):
+        if self.has_pending():
+            threading.Thread(target=self.replay, args=(apply,), name="revocation-replay", daemon=True).start()
+
+    def _run(self, apply, ready, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                if ready() and self.has_pending():
+                    self.replay(apply)
+            except Exception as e:
+                logger.warning("토큰 폐기 재적용 중 오류: %s", e)
+
+    """
+    주기적으로 보관된 기록을 재적용하는 스레드 시작
+    실패가 임계치 미만이라 서킷 상태가 바뀌지 않은 채 보관된 기록이나
+    종료된 워커가 남긴 기록도 interval 안에 재적용됨
+    ready(): 재적용을 시도할지 판단 (장애 중에 기록을 반복해서 다시 쓰지 않도록)
+    """
+    def start(self, apply, ready, interval: float = REVOCATION_REPLAY_INTERVAL):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(apply, ready, interval), name="revocation-replay-tick", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
@@ -1,75 +1,235 @@
-from datetime import timedelta
-from src.app.core.redis_config import redis_client
-from src.app.utils.auth import REFRESH_TOKEN_EXPIRE_DAYS
+import math
+import time
+
+from fastapi import HTTPException
+
+from src.app.core.circuit_breaker import CLOSED, DependencyUnavailableError
+from src.app.core.metrics import record_cache
+from src.app.core.redis_config import redis_breaker, redis_client, user_key
+from src.app.core.redis_maintenance import delete_keys
+from src.app.services.blacklist_mirror import CLEAR_MESSAGE, BlacklistMirror
+from src.app.services.revocation_buffer import REVOCATION_BUFFER_DIR, RevocationBuffer
+from src.app.utils.auth import jwt_codec
+from src.app.utils.jwt_codec import JWTDecodeError
 
 TOKEN_BLACKLIST_PREFIX = "blacklist:" # 토큰 블랙리스트 키 접두사
-REFRESH_TOKEN_PREFIX = "refresh:"  # Refresh 토큰 저장 접두사
+TOKEN_BLACKLIST_CHANNEL = "blacklist-events"  # 블랙리스트 추가 알림 pub/sub 채널
+BLACKLIST_MIRROR_ENABLED = True  # 워커별 로컬 블랙리스트 사본 사용 여부
+REFRESH_TOKEN_PREFIX = "refresh_tokens:"  # Refresh 토큰 저장 접두사 (사용자별 sorted set: jti -> 만료 시각, 키는 refresh_tokens:{user_id})
 DEFAULT_TOKEN_EXPIRY = 60 * 30  # 토큰 유효 기간 (초)
+MAX_REFRESH_TOKENS_PER_USER = 10  # 사용자별 최대 로그인 기기 수 (초과 시 가장 오래된 토큰부터 제거)
+
+# Redis 장애 시 동작 정책
+FAIL_OPEN = "open"  # 가능한 범위에서 요청을 계속 처리
+FAIL_CLOSED = "closed"  # 503으로 거절
+REDIS_FAILURE_POLICY = {
+    "blacklist_check": FAIL_OPEN,  # 로컬 블랙리스트 사본(최신이 아닐 수 있음)으로 판단
+    "refresh_store": FAIL_OPEN,  # 로그인은 허용하되 refresh 토큰은 저장되지 않음
+    "refresh_validate": FAIL_CLOSED,  # 토큰 갱신 거절
+}
+# 블랙리스트 추가/refresh 토큰 폐기는 정책과 무관하게 로컬에 보관 후 복구 시 재적용
+
+"""
+refresh 토큰에서 (jti, 만료 시각)을 추출 (서명이 유효하지 않으면 None)
+"""
+def _refresh_token_key(refresh_token: str):
+    try:
+        payload = jwt_codec.decode(refresh_token, verify_exp=False)
+    except JWTDecodeError:
+        return None
+
+    jti, exp = payload.get("jti"), payload.get("exp")
+    if jti is None or exp is None:
+        return None
+    return jti, exp
+
+# 워커별 블랙리스트 로컬 사본 (lifespan에서 구독 시작)
+blacklist_mirror = BlacklistMirror(TOKEN_BLACKLIST_PREFIX, TOKEN_BLACKLIST_CHANNEL)
+
+# Redis 장애 중 토큰 폐기를 보관하는 로컬 버퍼
+revocation_buffer = RevocationBuffer(REVOCATION_BUFFER_DIR)
+
+"""
+서킷 브레이커를 거쳐 Redis 작업을 실행하고, 장애 시 작업별 정책에 따라
+fallback 결과를 반환하거나 503을 발생시킴
+"""
+def _call_redis(operation: str, func, fallback=None):
+    try:
+        return redis_breaker.call(func)
+    except DependencyUnavailableError:
+        if REDIS_FAILURE_POLICY[operation] == FAIL_CLOSED:
+            raise HTTPException(
+                status_code=503,
+                detail="일시적으로 서비스를 이용할 수 없습니다.",
+                headers={"Retry-After": str(max(1, math.ceil(redis_breaker.reset_timeout)))},
+            )
+        return fallback() if fallback else None
 
 class TokenService:
+    @classmethod
+    def _write_blacklist(cls, token: str, expires_at: float):
+        expires_in = int(expires_at - time.time())
+        if expires_in <= 0:
+            return
+
+        # 저장과 동시에 다른 워커의 로컬 사본에 알림
+        # (트랜잭션 없는 파이프라인: 클러스터에서는 명령별로 해당 노드에 전달됨)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(f"{TOKEN_BLACKLIST_PREFIX}{token}", "1", ex=expires_in)
+        pipe.publish(TOKEN_BLACKLIST_CHANNEL, blacklist_mirror.format_message(token, expires_in))
+        pipe.execute()
+
+    @classmethod
+    def _write_refresh_revocation(cls, user_id: int, jti: str | None):
+        key = user_key(REFRESH_TOKEN_PREFIX, user_id)
+        if jti is None:
+            redis_client.delete(key)
+        else:
+            redis_client.zrem(key, jti)
+
+    """
+    로컬 버퍼에 보관된 토큰 폐기 기록 하나를 Redis에 재적용
+    """
+    @classmethod
+    def _replay_revocation(cls, record: dict):
+        if record["op"] == "blacklist":
+            redis_breaker.call(cls._write_blacklist, record["token"], record["expires_at"])
+        elif record["op"] == "revoke_refresh":
+            redis_breaker.call(cls._write_refresh_revocation, record["user_id"], record["jti"])
+
+    """
+    Redis 복구(서킷 closed) 시 보관된 토큰 폐기를 백그라운드에서 재적용합니다.
+    """
+    @classmethod
+    def replay_buffered_revocations(cls):
+        revocation_buffer.replay_in_background(cls._replay_revocation)
+
+    """
+    서킷 상태 변화와 관계없이 보관된 토큰 폐기를 주기적으로 재적용 (서킷이 닫혀 있을 때만)
+    """
+    @classmethod
+    def start_revocation_replay(cls):
+        revocation_buffer.start(cls._replay_revocation, lambda: redis_breaker.state == CLOSED)
+
+    @classmethod
+    def stop_revocation_replay(cls):
+        revocation_buffer.stop()
+
     """
     토큰을 블랙리스트에 추가합니다.
     expires_in: 블랙리스트에 보관할 시간(초) - 토큰 만료 시간과 일치해야 함
+    Redis 장애 시에는 로컬에 보관했다가 복구 후 재적용합니다.
     """
     @classmethod
     def blacklist_token(cls, token: str, expires_in: int = DEFAULT_TOKEN_EXPIRY):
-        key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-        redis_client.set(key, "1", ex=expires_in)
+        expires_at = time.time() + expires_in
+
+        # 현재 워커에는 즉시 반영
+        blacklist_mirror.add(token, expires_at)
+
+        try:
+            redis_breaker.call(cls._write_blacklist, token, expires_at)
+        except DependencyUnavailableError:
+            revocation_buffer.append({"op": "blacklist", "token": token, "expires_at": expires_at})
         return True
     
     """
     토큰이 블랙리스트에 있는지 확인합니다.
+    로컬 사본이 최신 상태면 Redis를 조회하지 않습니다.
     """
     @classmethod
     def is_token_blacklisted(cls, token: str) -> bool:
+        if BLACKLIST_MIRROR_ENABLED and blacklist_mirror.is_fresh():
+            record_cache("blacklist_mirror", True)
+            return blacklist_mirror.contains(token)
+
+        record_cache("blacklist_mirror", False)
         key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
-        return redis_client.exists(key) == 1
+        return _call_redis(
+            "blacklist_check",
+            lambda: redis_client.exists(key) == 1,
+            fallback=lambda: blacklist_mirror.contains(token),
+        )
     
     """
     모든 블랙리스트 토큰을 제거합니다. (테스트용)
+    키가 많을 때는 max_keys_per_second로 삭제 속도를 제한할 수 있습니다.
     """
     @classmethod
-    def clear_blacklist(cls):
-        
-        for key in redis_client.scan_iter(f"{TOKEN_BLACKLIST_PREFIX}*"):
-            redis_client.delete(key)
+    def clear_blacklist(cls, max_keys_per_second: float | None = None):
+        delete_keys(f"{TOKEN_BLACKLIST_PREFIX}*", max_keys_per_second=max_keys_per_second)
+
+        redis_client.publish(TOKEN_BLACKLIST_CHANNEL, CLEAR_MESSAGE)
+        blacklist_mirror.clear()
 
     """
     사용자 ID와 연결된 refresh 토큰을 저장합니다.
+    토큰 전체 대신 jti를 만료 시각을 점수로 하는 sorted set에 저장하고,
+    저장할 때마다 만료된 토큰을 정리하며 최대 기기 수를 넘으면 가장 오래된 토큰을 제거합니다.
     """
     @classmethod
     def store_refresh_token(cls, user_id: int, refresh_token: str):
-        # 사용자별 refresh 토큰 키
-        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
-        
-        # 토큰의 고유 식별자를 값으로 사용
-        # 동일한 사용자의 이전 refresh 토큰도 유지 (멀티 디바이스 지원)
-        redis_client.sadd(user_key, refresh_token)
-        
-        # Refresh 토큰 만료 시간 설정 (7일 + 여유 시간)
-        redis_client.expire(user_key, timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS + 1).total_seconds())
-        
-        return True
+        token_key = _refresh_token_key(refresh_token)
+        if token_key is None:
+            return False
+
+        jti, exp = token_key
+        key = user_key(REFRESH_TOKEN_PREFIX, user_id)
+
+        def store():
+            # 모든 명령이 같은 사용자 키(같은 슬롯)를 대상으로 하므로 클러스터에서도 한 노드로 전달됨
+            pipe = redis_client.pipeline(transaction=False)
+            # 만료된 토큰 정리
+            pipe.zremrangebyscore(key, "-inf", time.time())
+            pipe.zadd(key, {jti: exp})
+            # 최대 기기 수 초과분(만료가 가장 이른 = 가장 오래된 토큰) 제거
+            pipe.zremrangebyrank(key, 0, -(MAX_REFRESH_TOKENS_PER_USER + 1))
+            # 새 토큰이 가장 늦게 만료되므로 키도 그 시각에 만료
+            pipe.expireat(key, int(exp) + 1)
+            pipe.execute()
+            return True
+
+        return _call_redis("refresh_store", store, fallback=lambda: False)
     
     """
-    저장된 refresh 토큰이 유효한지 확인합니다.
+    저장된 refresh 토큰이 유효한지 확인합니다. (ZSCORE)
     """
     @classmethod
     def validate_refresh_token(cls, user_id: int, refresh_token: str) -> bool:
-        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
-        return redis_client.sismember(user_key, refresh_token)
+        token_key = _refresh_token_key(refresh_token)
+        if token_key is None:
+            return False
+
+        key = user_key(REFRESH_TOKEN_PREFIX, user_id)
+        expires_at = _call_redis("refresh_validate", lambda: redis_client.zscore(key, token_key[0]))
+        return expires_at is not None and expires_at > time.time()
     
     """
     특정 refresh 토큰 또는 사용자의 모든 refresh 토큰을 무효화합니다.
+    Redis 장애 시에는 로컬에 보관했다가 복구 후 재적용합니다.
     """
     @classmethod
     def revoke_refresh_token(cls, user_id: int, refresh_token: str = None):
-        user_key = f"{REFRESH_TOKEN_PREFIX}{user_id}"
-        
         # 특정 토큰만 삭제하거나 모든 토큰 삭제
+        jti = None
         if refresh_token:
-            redis_client.srem(user_key, refresh_token)
-        else:
-            redis_client.delete(user_key)
+            token_key = _refresh_token_key(refresh_token)
+            if token_key is None:
+                return True
+            jti = token_key[0]
+
+        try:
+            redis_breaker.call(cls._write_refresh_revocation, user_id, jti)
+        except DependencyUnavailableError:
+            revocation_buffer.append({"op": "revoke_refresh", "user_id": user_id, "jti": jti})
             
-        return True
\ No newline at end of file
+        return True
+
+"""
+서킷이 다시 닫히면(Redis 복구) 보관된 토큰 폐기 재적용
+"""
+def _on_redis_state_change(previous: str, state: str):
+    if state == CLOSED:
+        TokenService.replay_buffered_revocations()
+
+redis_breaker.on_state_change = _on_redis_state_change
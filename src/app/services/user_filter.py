@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from sqlalchemy import select
+
+from src.app.core.circuit_breaker import DependencyUnavailableError
+from src.app.core.metrics import record_cache
+from src.app.core.redis_config import redis_breaker, redis_client
+from src.app.database import SessionLocal
+from src.app.models.user import User
+
+logger = logging.getLogger("app.user_filter")
+
+# 예상 사용자 수와 허용 오탐률 (비트 수와 해시 함수 수 계산에 사용)
+USER_FILTER_CAPACITY = 1_000_000
+USER_FILTER_ERROR_RATE = 0.001
+
+USER_FILTER_PREFIX = "users:bloom:"
+USER_FILTER_READY_KEY = f"{USER_FILTER_PREFIX}ready"  # 워밍 완료 표시 (없으면 DB로 확인)
+USER_FILTER_WARMING_KEY = f"{USER_FILTER_PREFIX}warming"  # 워커 간 워밍 중복 방지 잠금
+USER_FILTER_WARMING_TIMEOUT = 300  # 워밍 잠금 유지 시간 (초)
+USER_FILTER_WARM_BATCH = 5000
+USER_FILTER_WARM_RETRY_INTERVAL = 60.0  # 워밍되지 않은 필터를 다시 워밍 시도하는 최소 간격 (초)
+
+_last_warm_attempt = float("-inf")
+
+"""
+Redis 비트맵(SETBIT/GETBIT) 기반 Bloom 필터 (모든 워커가 공유)
+might_contain이 False면 확실히 없음, True면 있을 수도 있음(오탐 가능)
+"""
+class BloomFilter:
+    def __init__(self, key: str, capacity: int, error_rate: float):
+        self.key = key
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+
+    """
+    이중 해싱으로 비트 위치 계산 (blake2b 128비트 다이제스트를 두 해시로 나눠 사용)
+    """
+    def _offsets(self, value: str):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add_to(self, pipe, value: str):
+        for offset in self._offsets(value):
+            pipe.setbit(self.key, offset, 1)
+
+    def might_contain(self, value: str) -> bool:
+        pipe = redis_client.pipeline(transaction=False)
+        for offset in self._offsets(value):
+            pipe.getbit(self.key, offset)
+        return all(pipe.execute())
+
+# 이메일/사용자 이름별 필터
+user_filters = {
+    "email": BloomFilter(f"{USER_FILTER_PREFIX}email", USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE),
+    "username": BloomFilter(f"{USER_FILTER_PREFIX}username", USER_FILTER_CAPACITY, USER_FILTER_ERROR_RATE),
+}
+
+"""
+값이 확실히 없으면 False, 있을 수도 있으면 True,
+필터를 쓸 수 없으면(워밍 전, Redis 장애) None을 반환 -> DB로 확인
+"""
+def might_exist(field: str, value: str) -> bool | None:
+    def check():
+        if not redis_client.exists(USER_FILTER_READY_KEY):
+            warm_in_background()
+            return None
+        return user_filters[field].might_contain(value)
+
+    try:
+        result = redis_breaker.call(check)
+    except DependencyUnavailableError:
+        result = None
+
+    if result is not None:
+        # 필터만으로 답한 경우(확실히 없음)를 적중으로 기록
+        record_cache("user_filter", result is False)
+    return result
+
+"""
+새 사용자(들)의 이메일/사용자 이름을 필터에 추가
+반영에 실패하면 필터를 신뢰할 수 없으므로 워밍 완료 표시를 지워 다시 워밍하게 함
+"""
+def add_users(users: list[tuple[str, str]]):
+    def add():
+        pipe = redis_client.pipeline(transaction=False)
+        for email, username in users:
+            user_filters["email"].add_to(pipe, email)
+            user_filters["username"].add_to(pipe, username)
+        pipe.execute()
+
+    try:
+        redis_breaker.call(add)
+    except DependencyUnavailableError as e:
+        logger.warning("사용자 필터 갱신 실패, 다시 워밍 필요: %s", e)
+        try:
+            redis_breaker.call(redis_client.delete, USER_FILTER_READY_KEY)
+        except DependencyUnavailableError:
+            pass
+
+"""
+users 테이블 전체로 필터 채우기 (워커 하나만 실행)
+Bloom 필터는 추가만 하므로 사용 중인 키에 그대로 채워도 되고,
+워밍 도중 가입한 사용자는 add_users로 따로 반영됨
+"""
+def warm():
+    if redis_client.exists(USER_FILTER_READY_KEY):
+        return
+    if not redis_client.set(USER_FILTER_WARMING_KEY, "1", nx=True, ex=USER_FILTER_WARMING_TIMEOUT):
+        return
+
+    count = 0
+    try:
+        with SessionLocal() as db:
+            rows = db.execute(
+                select(User.email, User.username).execution_options(yield_per=USER_FILTER_WARM_BATCH)
+            )
+            for batch in rows.partitions():
+                pipe = redis_client.pipeline(transaction=False)
+                for email, username in batch:
+                    user_filters["email"].add_to(pipe, email)
+                    user_filters["username"].add_to(pipe, username)
+                pipe.execute()
+                count += len(batch)
+
+        redis_client.set(USER_FILTER_READY_KEY, "1")
+        logger.info("사용자 필터 워밍 완료: %d명", count)
+    finally:
+        redis_client.delete(USER_FILTER_WARMING_KEY)
+
+"""
+백그라운드 스레드에서 워밍 (시작을 막지 않도록)
+"""
+def warm_in_background():
+    global _last_warm_attempt
+    now = time.monotonic()
+    if now - _last_warm_attempt < USER_FILTER_WARM_RETRY_INTERVAL:
+        return
+    _last_warm_attempt = now
+
+    def run():
+        try:
+            warm()
+        except Exception as e:
+            logger.warning("사용자 필터 워밍 실패: %s", e)
+
+    threading.Thread(target=run, name="user-filter-warm", daemon=True).start()
@@ -0,0 +1,297 @@
+"""
+사용자 일괄 등록
+
+CSV(email,username,password 헤더) 또는 NDJSON 파일을 한 줄씩 읽어 배치 단위로 처리합니다.
+- 비밀번호 해시는 프로세스 풀에서 모든 코어로 병렬 계산
+- 기존 이메일/사용자 이름 중복은 배치별 IN 조회 두 번으로 확인
+- 배치마다 한 트랜잭션으로 INSERT
+- 행별 처리 결과를 생성되는 대로 반환 (스트리밍 응답/CLI 출력)
+
+CLI 실행 예:
+    python -m src.app.services.user_import users.csv --batch-size 500
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from src.app.core.uploads import remove_file
+from src.app.database import SessionLocal
+from src.app.models.user import User
+from src.app.schemas.user import UserCreate
+from src.app.services import user_filter
+from src.app.services.user_service import conflict_error
+from src.app.utils.security import get_password_hash
+
+BULK_IMPORT_BATCH_SIZE = 500  # 한 트랜잭션으로 INSERT할 사용자 수
+BULK_IMPORT_WORKERS = int(os.environ.get("BULK_IMPORT_WORKERS", "0")) or os.cpu_count()  # 해시 프로세스 수
+BULK_IMPORT_MAX_SIZE = int(os.environ.get("BULK_IMPORT_MAX_SIZE", str(100 * 1024 * 1024)))  # 업로드 파일 최대 크기 (바이트)
+BULK_IMPORT_UPLOAD_DIR = os.path.join(tempfile.gettempdir(), "user-import")  # 업로드 파일을 처리 전까지 보관할 위치
+# API로 일괄 등록할 수 있는 사용자 이름 (쉼표로 구분, 비어 있으면 API 등록을 막고 CLI로만 등록)
+BULK_IMPORT_ADMINS = frozenset(
+    name.strip() for name in os.environ.get("BULK_IMPORT_ADMINS", "").split(",") if name.strip()
+)
+BULK_IMPORT_MAX_ROWS = int(os.environ.get("BULK_IMPORT_MAX_ROWS", "100000"))  # API 요청 하나로 등록할 수 있는 최대 행 수
+BULK_IMPORT_MAX_CONCURRENT = int(os.environ.get("BULK_IMPORT_MAX_CONCURRENT", "1"))  # 워커별 동시 API 일괄 등록 수
+
+# API 일괄 등록 슬롯 (해시 프로세스 풀을 모든 코어로 쓰므로 동시에 여러 건을 처리하지 않음)
+_import_slots = threading.BoundedSemaphore(BULK_IMPORT_MAX_CONCURRENT)
+
+# 지원 형식 (파일 확장자/Content-Type -> 형식)
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    "text/csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    "application/x-ndjson": "ndjson",
+}
+
+_hash_pool = None
+
+"""
+비밀번호 해시용 프로세스 풀 (첫 사용 시 생성, multiprocessing도 이때 불러옴)
+스레드가 있는 프로세스를 fork하지 않도록 spawn 방식 사용
+"""
+def get_hash_pool():
+    global _hash_pool
+    if _hash_pool is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        _hash_pool = ProcessPoolExecutor(BULK_IMPORT_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _hash_pool
+
+def shutdown_hash_pool():
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(cancel_futures=True)
+        _hash_pool = None
+
+"""
+파일 이름/Content-Type으로 형식 판단 (알 수 없으면 None)
+"""
+def detect_format(filename: str | None, content_type: str | None) -> str | None:
+    extension = os.path.splitext(filename or "")[1].lower()
+    return IMPORT_FORMATS.get(extension) or IMPORT_FORMATS.get((content_type or "").split(";")[0].strip())
+
+"""
+텍스트 스트림에서 (행 번호, 데이터 dict 또는 파싱 오류 메시지)를 한 줄씩 읽음
+"""
+def read_rows(stream, fmt: str):
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_number, "JSON 형식이 아닙니다."
+            continue
+        yield line_number, data if isinstance(data, dict) else "JSON 객체가 아닙니다."
+
+"""
+파일의 행 수가 max_rows를 넘는지 확인 (넘는 순간 읽기 중단)
+"""
+def exceeds_row_limit(path: str, fmt: str, max_rows: int = BULK_IMPORT_MAX_ROWS) -> bool:
+    with open(path, encoding="utf-8-sig", newline="", errors="replace") as stream:
+        for count, _ in enumerate(read_rows(stream, fmt), start=1):
+            if count > max_rows:
+                return True
+    return False
+
+"""
+API 일괄 등록 슬롯을 기다리지 않고 얻음 (얻지 못하면 False)
+"""
+def try_acquire_import_slot() -> bool:
+    return _import_slots.acquire(blocking=False)
+
+def release_import_slot():
+    _import_slots.release()
+
+def _batches(rows, size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+class UserImportService:
+    def __init__(self, batch_size: int = BULK_IMPORT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.seen_emails = set()
+        self.seen_usernames = set()
+        self.summary = {"created": 0, "duplicate": 0, "invalid": 0}
+
+    def _result(self, line: int, status: str, **fields) -> dict:
+        self.summary[status] += 1
+        return {"line": line, "status": status, **fields}
+
+    """
+    배치 하나 처리: 검증 -> 중복 제거(파일 내 + DB) -> 병렬 해시 -> 일괄 INSERT
+    """
+    def _import_batch(self, db, batch) -> list[dict]:
+        results = []
+        candidates = []
+        for line, data in batch:
+            if isinstance(data, str):
+                results.append(self._result(line, "invalid", detail=data))
+                continue
+            try:
+                user = UserCreate.model_validate(data)
+            except ValidationError as e:
+                # 입력값(비밀번호 포함)은 결과에 남기지 않음
+                detail = [{"loc": error["loc"], "msg": error["msg"]} for error in e.errors()]
+                results.append(self._result(line, "invalid", detail=detail))
+                continue
+            candidates.append((line, user))
+
+        # 기존 사용자와의 중복은 배치당 IN 조회 두 번으로 확인
+        emails = {user.email for _, user in candidates}
+        usernames = {user.username for _, user in candidates}
+        existing_emails = set(db.scalars(select(User.email).where(User.email.in_(emails)))) if emails else set()
+        existing_usernames = set(db.scalars(select(User.username).where(User.username.in_(usernames)))) if usernames else set()
+
+        accepted = []
+        for line, user in candidates:
+            if user.email in existing_emails or user.email in self.seen_emails:
+                results.append(self._result(line, "duplicate", email=user.email, detail="이미 존재하는 이메일입니다."))
+            elif user.username in existing_usernames or user.username in self.seen_usernames:
+                results.append(self._result(line, "duplicate", email=user.email, detail="이미 존재하는 사용자 이름입니다."))
+            else:
+                self.seen_emails.add(user.email)
+                self.seen_usernames.add(user.username)
+                accepted.append((line, user))
+
+        if accepted:
+            passwords = [user.password for _, user in accepted]
+            chunksize = max(1, len(passwords) // (BULK_IMPORT_WORKERS * 4))
+            hashes = list(get_hash_pool().map(get_password_hash, passwords, chunksize=chunksize))
+            values = [
+                {"email": user.email, "username": user.username, "password": hashed}
+                for (_, user), hashed in zip(accepted, hashes)
+            ]
+            results.extend(self._insert(db, accepted, values))
+
+        results.sort(key=lambda result: result["line"])
+        return results
+
+    """
+    배치를 한 트랜잭션으로 INSERT
+    그 사이 다른 요청으로 가입한 사용자와 충돌하면 해당 배치만 한 명씩 다시 시도
+    """
+    def _insert(self, db, accepted, values) -> list[dict]:
+        try:
+            ids = db.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), values).all()
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return self._insert_one_by_one(db, accepted, values)
+
+        user_filter.add_users([(value["email"], value["username"]) for value in values])
+        return [
+            self._result(line, "created", email=user.email, id=user_id)
+            for (line, user), user_id in zip(accepted, ids)
+        ]
+
+    def _insert_one_by_one(self, db, accepted, values) -> list[dict]:
+        results = []
+        for (line, user), value in zip(accepted, values):
+            try:
+                user_id = db.scalar(insert(User).values(**value).returning(User.id))
+                db.commit()
+            except IntegrityError as e:
+                db.rollback()
+                results.append(self._result(line, "duplicate", email=user.email, detail=conflict_error(e).detail))
+                continue
+            user_filter.add_users([(value["email"], value["username"])])
+            results.append(self._result(line, "created", email=user.email, id=user_id))
+        return results
+
+    """
+    텍스트 스트림의 사용자들을 등록하고 행별 결과를 생성되는 대로 반환
+    마지막에 {"summary": {...}} 반환
+    """
+    def import_users(self, stream, fmt: str):
+        started = time.perf_counter()
+        with SessionLocal() as db:
+            for batch in _batches(read_rows(stream, fmt), self.batch_size):
+                yield from self._import_batch(db, batch)
+
+        yield {"summary": {**self.summary, "seconds": round(time.perf_counter() - started, 2)}}
+
+"""
+바이너리 파일을 등록하고 결과를 NDJSON 줄로 반환 (스트리밍 응답 본문)
+"""
+def import_users_ndjson(file, fmt: str, batch_size: int = BULK_IMPORT_BATCH_SIZE):
+    try:
+        stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        for result in UserImportService(batch_size).import_users(stream, fmt):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+    finally:
+        file.close()
+
+"""
+업로드로 받은 임시 파일을 등록하고 결과를 NDJSON 줄로 반환하는 생성기
+끝나면 임시 파일을 지우고 on_close() 호출
+스트리밍을 시작하기 전에 연결이 끊겨 생성기가 그대로 버려져도 같은 정리를 한 번 실행
+"""
+def import_uploaded_file_ndjson(path: str, fmt: str, batch_size: int = BULK_IMPORT_BATCH_SIZE, on_close=None):
+    def cleanup():
+        remove_file(path)
+        if on_close is not None:
+            on_close()
+
+    def results():
+        try:
+            yield from import_users_ndjson(open(path, "rb"), fmt, batch_size)
+        finally:
+            finalizer()
+
+    body = results()
+    finalizer = weakref.finalize(body, cleanup)
+    return body
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="사용자 일괄 등록")
+    parser.add_argument("path", help="CSV(email,username,password) 또는 NDJSON 파일")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None, help="파일 형식 (기본: 확장자로 판단)")
+    parser.add_argument("--batch-size", type=int, default=BULK_IMPORT_BATCH_SIZE, help="트랜잭션당 사용자 수")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or detect_format(args.path, None)
+    if fmt is None:
+        raise SystemExit("파일 형식을 알 수 없습니다. --format을 지정해주세요.")
+
+    from src.app.core.migrations import migrate
+    from src.app.database import engine
+
+    migrate(engine)
+    try:
+        with open(args.path, "rb") as file:
+            for line in import_users_ndjson(file, fmt, args.batch_size):
+                sys.stdout.write(line)
+    finally:
+        shutdown_hash_pool()
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,65 @@
-from sqlalchemy import select
+from sqlalchemy import exists, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import Depends, HTTPException
 
 from src.app.database import get_db
 from src.app.models.user import User
 from src.app.schemas.user import UserCreate
+from src.app.services import user_filter
 from src.app.utils.security import get_password_hash
 
+# 고유 제약 조건 위반 시 응답 메시지 (DB 오류 메시지에 포함된 컬럼명으로 구분)
+CONFLICT_DETAILS = {
+    "email": "이미 존재하는 이메일입니다.",
+    "username": "이미 존재하는 사용자 이름입니다.",
+}
+
+"""
+고유 제약 조건 위반 오류를 409 응답으로 변환
+"""
+def conflict_error(error: IntegrityError) -> HTTPException:
+    message = str(error.orig)
+    for column, detail in CONFLICT_DETAILS.items():
+        if column in message:
+            return HTTPException(status_code=409, detail=detail)
+    return HTTPException(status_code=409, detail="이미 존재하는 사용자입니다.")
+
 class UserService:
     def __init__(self, db: Session):
             self.db = db
             
+    """
+    사용자 생성 (중복 확인 조회 없이 INSERT 한 번, 중복은 고유 제약 조건으로 판단)
+    """
     def create_user(self, user: UserCreate):
-        # 이메일 중복 확인
-        db_user = self.get_user_by_email(user.email)
-    
-        if db_user:
-            raise HTTPException(
-                status_code=400,
-                detail="이미 존재하는 이메일입니다."
-            )
-            
-        # 사용자명 중복 확인
-        db_user = self.get_user_by_username(user.username)
-        if db_user:
-            raise HTTPException(
-                status_code=400,
-                detail="이미 존재하는 사용자 이름입니다."
-            )
-        
-        # 새 사용자 생성
         hashed_password = get_password_hash(user.password)
-        db_user = User(
-            email=user.email,
-            username=user.username,
-            hashed_password=hashed_password
+        query = (
+            insert(User).
+            values(email=user.email, username=user.username, password=hashed_password).
+            returning(User)
         )
-        
-        self.db.add(db_user)
-        self.db.commit()
-        self.db.refresh(db_user)
-        
+
+        try:
+            db_user = self.db.execute(query).scalar_one()
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            raise conflict_error(e)
+
+        user_filter.add_users([(db_user.email, db_user.username)])
         return db_user
     
+    """
+    이메일/사용자 이름 사용 가능 여부 (필터에서 확실히 없다고 하면 DB를 조회하지 않음)
+    """
+    def is_available(self, field: str, value: str) -> bool:
+        if user_filter.might_exist(field, value) is False:
+            return True
+
+        column = getattr(User, field)
+        return not self.db.execute(select(exists().where(column == value))).scalar()
+
     def get_user_by_email(self, email: str):
         query = (
             select(User).
@@ -58,4 +75,4 @@ class UserService:
         return self.db.execute(query).scalar_one_or_none()
     
 def get_user_service(db: Session = Depends(get_db)):
-    return UserService(db)
\ No newline at end of file
+    return UserService(db)
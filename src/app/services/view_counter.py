@@ -0,0 +1,138 @@
+import logging
+import threading
+from collections import defaultdict
+
+from sqlalchemy import bindparam, update
+
+from src.app.core.circuit_breaker import DependencyUnavailableError
+from src.app.core.redis_config import redis_breaker, redis_client
+from src.app.database import SessionLocal
+from src.app.models.post import Post
+
+logger = logging.getLogger("app.view_counter")
+
+VIEW_COUNTER_ENABLED = True
+VIEW_FLUSH_INTERVAL = 5.0  # DB/Redis 반영 주기 (초)
+POST_VIEWERS_PREFIX = "post_viewers:"  # 게시글별 순 방문자 HyperLogLog 키 접두사
+
+# 누적 조회수 증가분을 한 트랜잭션에서 executemany로 반영
+_increment_views = (
+    update(Post.__table__).
+    where(Post.__table__.c.id == bindparam("post_id")).
+    values(views=Post.__table__.c.views + bindparam("delta"))
+)
+
+def _viewers_key(post_id: int) -> str:
+    return f"{POST_VIEWERS_PREFIX}{post_id}"
+
+"""
+워커별 게시글 조회수 버퍼
+
+읽기 경로에서는 메모리의 카운터만 증가시키고(DB/Redis 호출 없음),
+백그라운드 스레드가 주기적으로 모은 증가분을 DB에 한 번에 반영하고
+방문자 식별자를 Redis HyperLogLog(PFADD)에 추가합니다.
+"""
+class ViewCounter:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._views: dict[int, int] = defaultdict(int)
+        self._viewers: dict[int, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, post_id: int, viewer: str):
+        with self._lock:
+            self._views[post_id] += 1
+            self._viewers[post_id].add(viewer)
+
+    """
+    아직 DB에 반영하지 않은 현재 워커의 조회수
+    """
+    def pending(self, post_id: int) -> int:
+        return self._views.get(post_id, 0)
+
+    def _swap(self):
+        with self._lock:
+            views, self._views = self._views, defaultdict(int)
+            viewers, self._viewers = self._viewers, defaultdict(set)
+        return views, viewers
+
+    def _restore(self, views: dict[int, int]):
+        with self._lock:
+            for post_id, delta in views.items():
+                self._views[post_id] += delta
+
+    """
+    모아 둔 조회수를 DB에, 방문자를 Redis에 반영
+    DB 반영에 실패하면 증가분을 되돌려 다음 주기에 다시 시도
+    """
+    def flush(self):
+        views, viewers = self._swap()
+
+        if views:
+            params = [{"post_id": post_id, "delta": delta} for post_id, delta in views.items()]
+            try:
+                with SessionLocal() as db:
+                    db.execute(_increment_views, params)
+                    db.commit()
+            except Exception as e:
+                logger.warning("조회수 반영 실패, 다음 주기에 재시도: %s", e)
+                self._restore(views)
+
+        if viewers:
+            def add_viewers():
+                pipe = redis_client.pipeline(transaction=False)
+                for post_id, members in viewers.items():
+                    pipe.pfadd(_viewers_key(post_id), *members)
+                pipe.execute()
+
+            # 순 방문자는 근사치이므로 Redis 장애 시에는 버림
+            try:
+                redis_breaker.call(add_viewers)
+            except DependencyUnavailableError as e:
+                logger.warning("순 방문자 반영 실패: %s", e)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("조회수 반영 중 오류: %s", e)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="view-counter", daemon=True)
+        self._thread.start()
+
+    """
+    반영 스레드를 멈추고 남은 조회수를 반영 (종료 시)
+    """
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.flush()
+
+"""
+게시글의 순 방문자 수 근사치 (HyperLogLog), Redis 장애 시 None
+"""
+def unique_viewers(post_id: int) -> int | None:
+    try:
+        return redis_breaker.call(redis_client.pfcount, _viewers_key(post_id))
+    except DependencyUnavailableError:
+        return None
+
+"""
+삭제된 게시글의 방문자 기록 제거
+"""
+def forget(post_id: int):
+    try:
+        redis_breaker.call(redis_client.delete, _viewers_key(post_id))
+    except DependencyUnavailableError:
+        pass
+
+view_counter = ViewCounter(VIEW_FLUSH_INTERVAL)
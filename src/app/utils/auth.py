@@ -1,9 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 import time
 from typing import Optional
-import uuid
 
-from jose import jwt, JWTError
+from src.app.core.timing import timed
+from src.app.utils.jwt_codec import HS256Codec, JWTDecodeError
 
 # 실제 배포시에는 환경 변수로 보관해야 합니다
 SECRET_KEY = "1234567890abcdefghijklmnopqrstuvwxyz"
@@ -11,66 +11,76 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# HS256 전용 JWT 코덱 (헤더/HMAC 키 상태를 미리 계산)
+jwt_codec = HS256Codec(SECRET_KEY)
+
 """
 JWT 액세스 토큰을 생성합니다.
 """
+@timed("jwt")
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     
     # 만료 시간 설정(30분)
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     # JWT 페이로드에 만료 시간 추가
     to_encode.update({
         "exp": expire,
-        "jti": str(uuid.uuid4())  # 토큰 고유 ID 추가
+        "jti": jwt_codec.new_jti()  # 토큰 고유 ID 추가
     })
     
     # JWT 토큰 생성
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return jwt_codec.encode(to_encode)
 
 """
 JWT refresh 토큰을 생성합니다.
 """
+@timed("jwt")
 def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     
     # 만료 시간 설정(7일)
-    expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
     
     # JWT 페이로드에 만료 시간과 고유 ID 추가
     to_encode.update({
         "exp": expire,
-        "jti": str(uuid.uuid4()),  # 토큰 고유 ID 추가
+        "jti": jwt_codec.new_jti(),  # 토큰 고유 ID 추가
         "type": "refresh"  # 토큰 타입 명시
     })
     
     # JWT 토큰 생성
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    return jwt_codec.encode(to_encode)
 
 """
 JWT 토큰을 검증하고 페이로드를 반환합니다.
+token_type이 주어지면 토큰의 type 클레임이 일치해야 합니다.
 """
-def verify_token(token: str) -> dict:
+@timed("jwt")
+def verify_token(token: str, token_type: Optional[str] = None) -> dict:
     try:
         # 토큰 디코딩 및 검증
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        payload = jwt_codec.decode(token)
+    except JWTDecodeError:
         # 토큰이 유효하지 않을 경우 None 반환
         return None
+
+    if token_type is not None and payload.get("type") != token_type:
+        return None
+
+    return payload
     
 """
 JWT 토큰의 남은 만료 시간을 초 단위로 계산
 """
+@timed("jwt")
 def get_token_expiry(token: str) -> int:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_signature": True})
+        payload = jwt_codec.decode(token)
         exp = payload.get("exp")
         
         if exp:
@@ -78,8 +88,8 @@ def get_token_expiry(token: str) -> int:
             remaining = exp - time.time()
             # 최소 1초 이상 설정
             return max(int(remaining), 1)
-    except:
+    except JWTDecodeError:
         pass
     
     # 기본값 (30분)
-    return ACCESS_TOKEN_EXPIRE_MINUTES * 60
\ No newline at end of file
+    return ACCESS_TOKEN_EXPIRE_MINUTES * 60
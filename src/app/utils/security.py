@@ -1,9 +1,65 @@
-from passlib.context import CryptContext
+import os
+import time
+from functools import cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.app.core.timing import timed
 
+# bcrypt 비용(rounds, 2^rounds번 반복). 서버 성능에 맞춰 benchmarks/bcrypt_cost.py로 보정
+# 값을 바꾸면 기존 비밀번호는 다음 로그인 때 새 비용으로 다시 해시됨
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+BCRYPT_MIN_ROUNDS = 4
+BCRYPT_MAX_ROUNDS = 31
+
+"""
+비밀번호 해시 컨텍스트
+passlib/bcrypt import 비용을 앱 시작이 아닌 첫 사용 시점으로 지연
+"""
+@cache
+def get_pwd_context(rounds: int = BCRYPT_ROUNDS):
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+@timed("bcrypt")
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
+@timed("bcrypt")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+"""
+저장된 해시가 현재 설정(BCRYPT_ROUNDS)과 다른 비용이면 True (로그인 성공 시 다시 해시)
+"""
+def password_needs_update(hashed_password: str) -> bool:
+    return get_pwd_context().needs_update(hashed_password)
+
+"""
+rounds 비용으로 해시 한 번에 걸리는 시간(ms) 측정 (repeat번 중 최솟값)
+"""
+def measure_hash_ms(rounds: int, repeat: int = 3) -> float:
+    context = get_pwd_context(rounds)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+"""
+현재 서버에서 해시 시간이 target_ms를 넘지 않는 가장 높은 비용을 찾음
+비용이 1 늘면 시간이 두 배가 되므로 낮은 비용에서 측정한 시간으로 추정 후 확인
+"""
+def calibrate_rounds(target_ms: float, repeat: int = 3) -> tuple[int, float]:
+    base_rounds = 8
+    base_ms = measure_hash_ms(base_rounds, repeat)
+    rounds = base_rounds
+    while rounds < BCRYPT_MAX_ROUNDS and base_ms * 2 ** (rounds + 1 - base_rounds) <= target_ms:
+        rounds += 1
+
+    # 추정값을 실제로 측정해 보정
+    measured = measure_hash_ms(rounds, repeat)
+    while measured > target_ms and rounds > BCRYPT_MIN_ROUNDS:
+        rounds -= 1
+        measured = measure_hash_ms(rounds, repeat)
+    return rounds, measured
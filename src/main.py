@@ -1,10 +1,19 @@
+import time
+
+_import_start = time.perf_counter()
+
 from fastapi import FastAPI
 
-from .app.apis import post, user, auth
+from .app.apis import post, user, auth, metrics, debug
+from .app.core.lifespan import lifespan
+from .app.core.middlewares.admission import setup_admission
 from .app.core.middlewares.cors import setup_cors
+from .app.core.middlewares.metrics import setup_metrics
+from .app.core.middlewares.query_profiler import setup_query_profiler
 from .app.core.middlewares.security import setup_security
-from .app.core.redis_config import init_redis
-from .app.database import Base, engine
+from .app.core.middlewares.timing import setup_timing
+from .app.core.query_profiler import QUERY_PROFILER_ENABLED
+from .app.database import engine
 
 
 app = FastAPI(
@@ -12,19 +21,26 @@ app = FastAPI(
     description="게시판과 NCP 메일 발송 기능을 제공하는 API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,  # 스키마 마이그레이션, 헬스 체크, 시작 시간 리포트
 )
 
 # 미들웨어 설정
+setup_admission(app)  # 가장 안쪽: 거절 응답에도 CORS/보안 헤더와 메트릭이 적용되도록 먼저 등록
 setup_cors(app)
 setup_security(app)
-
-# Redis 초기화
-init_redis(app)
+setup_metrics(app)
+setup_query_profiler(app)
+setup_timing(app)  # 가장 바깥에서 전체 요청 시간을 측정하도록 마지막에 등록
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(post.router, prefix="/posts", tags=["post"])
 app.include_router(user.router, tags=["user"])
+app.include_router(metrics.router, tags=["metrics"])
+
+# 쿼리 통계 디버그 엔드포인트는 프로파일러가 켜진 경우에만 노출
+if QUERY_PROFILER_ENABLED:
+    app.include_router(debug.router, prefix="/debug", tags=["debug"])
 
 @app.get("/")
 def health_check():
@@ -37,10 +53,9 @@ async def ping_db():
             return {"status": "connected"}
     except Exception as e:
         return {"status": "error", "message": str(e)}
-    
-@app.on_event("startup")
-def init_db():
-    Base.metadata.create_all(bind=engine)
+
+# 앱 import에 걸린 시간 (시작 리포트에 포함)
+app.state.import_seconds = time.perf_counter() - _import_start
 
 
 
@@ -0,0 +1,13 @@
+import fakeredis
+import pytest
+
+from src.app.core import redis_config
+
+"""
+redis_client가 실제 서버 대신 메모리 내 fakeredis를 사용하도록 교체
+"""
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_config, "_client", client)
+    return client
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from src.app.core.admission import AdmissionController, AdmissionRejected, _RouteClass, classify
+
+LIMITS = {
+    "read": {"priority": 0, "max_in_flight": 2, "max_queue": 2, "target_delay": 0.05, "interval": 0.5, "max_wait": 1.0},
+    "write": {"priority": 1, "max_in_flight": 2, "max_queue": 2, "target_delay": 0.05, "interval": 0.5, "max_wait": 1.0},
+}
+
+def route_class(**options) -> _RouteClass:
+    return _RouteClass("test", **{**LIMITS["read"], **options})
+
+@pytest.mark.parametrize("method, path, expected", [
+    ("GET", "/ping", None),
+    ("GET", "/debug/queries", None),
+    ("POST", "/auth/login", "auth"),
+    ("POST", "/register", "auth"),
+    ("GET", "/posts", "read"),
+    ("POST", "/posts", "write"),
+    ("POST", "/posts/1/attachments", "transfer"),
+    ("GET", "/posts/1/attachments/2", "transfer"),
+    ("GET", "/posts/1/attachments", "read"),
+    ("POST", "/users/import", "write"),
+])
+def test_classify(method, path, expected):
+    assert classify(method, path) == expected
+
+def test_codel_tolerates_short_spike():
+    rc = route_class()
+
+    assert not rc.should_drop(0.1, now=10.0)
+    assert not rc.should_drop(0.1, now=10.4)
+    # interval이 지나기 전에 목표 이하로 내려오면 혼잡 상태 해제
+    assert not rc.should_drop(0.01, now=10.45)
+    assert not rc.should_drop(0.1, now=10.6)
+    assert not rc.dropping
+
+def test_codel_drops_after_interval_above_target():
+    rc = route_class()
+
+    assert not rc.should_drop(0.1, now=10.0)
+    assert rc.should_drop(0.1, now=10.5)
+    assert rc.dropping
+    assert rc.should_drop(0.1, now=10.6)
+
+    assert not rc.should_drop(0.01, now=10.7)
+    assert not rc.dropping
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def settle():
+    # shield/wait_for를 거쳐 대기 중인 요청이 깨어날 때까지 몇 번 양보
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+def test_rejects_when_queue_full():
+    async def scenario():
+        controller = AdmissionController(LIMITS, max_in_flight=10)
+        for _ in range(2):
+            await controller.acquire("read")
+
+        waiting = [asyncio.create_task(controller.acquire("read")) for _ in range(2)]
+        await settle()
+        with pytest.raises(AdmissionRejected) as e:
+            await controller.acquire("read")
+        assert e.value.reason == "queue_full"
+
+        controller.release("read")
+        controller.release("read")
+        await asyncio.gather(*waiting)
+        assert controller.classes["read"].in_flight == 2
+
+    run(scenario())
+
+def test_global_limit_prefers_higher_priority():
+    async def scenario():
+        controller = AdmissionController(LIMITS, max_in_flight=2)
+        await controller.acquire("write")
+        await controller.acquire("write")
+
+        order = []
+        async def acquire(name):
+            await controller.acquire(name)
+            order.append(name)
+
+        write = asyncio.create_task(acquire("write"))
+        await settle()
+        read = asyncio.create_task(acquire("read"))
+        await settle()
+
+        controller.release("write")
+        await settle()
+        assert order == ["read"]
+
+        controller.release("write")
+        await asyncio.gather(read, write)
+        assert order == ["read", "write"]
+        assert controller.in_flight == 2
+
+    run(scenario())
+
+def test_times_out_waiting():
+    async def scenario():
+        limits = {"read": {**LIMITS["read"], "max_in_flight": 1, "max_wait": 0.05}}
+        controller = AdmissionController(limits, max_in_flight=10)
+        await controller.acquire("read")
+
+        with pytest.raises(AdmissionRejected) as e:
+            await controller.acquire("read")
+        assert e.value.reason == "timeout"
+        assert not controller.classes["read"].waiters
+
+    run(scenario())
+
+def test_sheds_standing_queue():
+    async def scenario():
+        limits = {"read": {**LIMITS["read"], "max_in_flight": 1, "max_queue": 10, "target_delay": 0.01, "interval": 0.02}}
+        controller = AdmissionController(limits, max_in_flight=10)
+        await controller.acquire("read")
+
+        waiting = [asyncio.create_task(controller.acquire("read")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        # 첫 대기 요청: 목표 초과가 시작된 것으로만 기록하고 처리
+        controller.release("read")
+        await asyncio.sleep(0.03)
+        # interval 동안 계속 목표를 넘었으므로 남은 대기 요청은 거절
+        controller.release("read")
+        results = await asyncio.gather(*waiting, return_exceptions=True)
+
+        assert results[0] is None
+        assert [e.reason for e in results[1:]] == ["congested", "congested"]
+        assert controller.classes["read"].in_flight == 0
+        # 대기열이 비면 혼잡 상태 해제
+        assert not controller.classes["read"].dropping
+        await controller.acquire("read")
+
+    run(scenario())
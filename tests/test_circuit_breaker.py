@@ -0,0 +1,120 @@
+import pytest
+
+from src.app.core import circuit_breaker
+from src.app.core.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    DependencyUnavailableError,
+)
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+@pytest.fixture
+def transitions():
+    return []
+
+@pytest.fixture
+def breaker(clock, transitions):
+    return CircuitBreaker(
+        "test",
+        is_failure=lambda e: isinstance(e, ConnectionError),
+        failure_threshold=3,
+        reset_timeout=5.0,
+        on_state_change=lambda previous, state: transitions.append((previous, state)),
+    )
+
+def fail():
+    raise ConnectionError("down")
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(DependencyUnavailableError):
+            breaker.call(fail)
+
+def test_opens_after_threshold(breaker, transitions):
+    for _ in range(breaker.failure_threshold - 1):
+        with pytest.raises(DependencyUnavailableError):
+            breaker.call(fail)
+    assert breaker.state == CLOSED
+
+    with pytest.raises(DependencyUnavailableError):
+        breaker.call(fail)
+    assert breaker.state == OPEN
+    assert transitions == [(CLOSED, OPEN)]
+
+def test_success_resets_failure_count(breaker):
+    for _ in range(breaker.failure_threshold - 1):
+        with pytest.raises(DependencyUnavailableError):
+            breaker.call(fail)
+    assert breaker.call(lambda: "ok") == "ok"
+
+    for _ in range(breaker.failure_threshold - 1):
+        with pytest.raises(DependencyUnavailableError):
+            breaker.call(fail)
+    assert breaker.state == CLOSED
+
+def test_open_rejects_without_calling(breaker):
+    trip(breaker)
+    calls = []
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(calls.append, 1)
+    assert calls == []
+
+def test_half_open_success_closes(breaker, clock, transitions):
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == CLOSED
+    assert transitions == [(CLOSED, OPEN), (HALF_OPEN, CLOSED)]
+
+def test_half_open_failure_reopens(breaker, clock):
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    with pytest.raises(DependencyUnavailableError):
+        breaker.call(fail)
+    assert breaker.state == OPEN
+
+    # 다시 열린 시점부터 reset_timeout 동안 거절
+    clock.now += breaker.reset_timeout - 0.1
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+def test_half_open_allows_single_trial(breaker, clock):
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    def trial():
+        # 시험 호출이 끝나기 전의 다른 호출은 거절
+        assert breaker.state == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "other")
+        return "ok"
+
+    assert breaker.call(trial) == "ok"
+    assert breaker.state == CLOSED
+
+def test_non_failure_exception_is_passed_through(breaker):
+    def bad_input():
+        raise ValueError("bad")
+
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ValueError):
+            breaker.call(bad_input)
+    assert breaker.state == CLOSED
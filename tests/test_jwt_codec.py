@@ -0,0 +1,67 @@
+import json
+import time
+
+import pytest
+
+from src.app.utils.jwt_codec import HS256Codec, JWTDecodeError, _b64encode
+
+SECRET = "test-secret"
+
+@pytest.fixture
+def codec():
+    return HS256Codec(SECRET)
+
+def _segment(data: dict) -> str:
+    return _b64encode(json.dumps(data).encode()).decode()
+
+def test_round_trip(codec):
+    claims = {"sub": "alice", "exp": int(time.time()) + 60}
+    assert codec.decode(codec.encode(claims)) == claims
+
+def test_rejects_alg_none(codec):
+    payload = _segment({"sub": "alice", "exp": int(time.time()) + 60})
+    header = _segment({"alg": "none", "typ": "JWT"})
+
+    for token in (f"{header}.{payload}.", f"{header}.{payload}"):
+        with pytest.raises(JWTDecodeError):
+            codec.decode(token)
+
+def test_rejects_other_algorithm_header(codec):
+    token = codec.encode({"sub": "alice"})
+    _, payload, signature = token.split(".")
+    header = _segment({"alg": "HS512", "typ": "JWT"})
+
+    with pytest.raises(JWTDecodeError):
+        codec.decode(f"{header}.{payload}.{signature}")
+
+def test_rejects_tampered_payload(codec):
+    header, _, signature = codec.encode({"sub": "alice"}).split(".")
+    payload = _segment({"sub": "admin"})
+
+    with pytest.raises(JWTDecodeError):
+        codec.decode(f"{header}.{payload}.{signature}")
+
+def test_rejects_tampered_signature(codec):
+    token = codec.encode({"sub": "alice"})
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    with pytest.raises(JWTDecodeError):
+        codec.decode(tampered)
+
+def test_rejects_other_secret(codec):
+    token = HS256Codec("other-secret").encode({"sub": "alice"})
+
+    with pytest.raises(JWTDecodeError):
+        codec.decode(token)
+
+@pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c.d", "!!.??.**"])
+def test_rejects_malformed(codec, token):
+    with pytest.raises(JWTDecodeError):
+        codec.decode(token)
+
+def test_rejects_expired(codec):
+    token = codec.encode({"sub": "alice", "exp": int(time.time()) - 1})
+
+    with pytest.raises(JWTDecodeError):
+        codec.decode(token)
+    assert codec.decode(token, verify_exp=False)["sub"] == "alice"
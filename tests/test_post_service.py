@@ -0,0 +1,76 @@
+import pytest
+from sqlalchemy import create_engine, delete, text, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.app.database import Base
+from src.app.models import attachment, post, user  # noqa: F401
+from src.app.models.post import Post
+from src.app.models.user import User
+from src.app.services.post_service import PostService
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        yield session
+    engine.dispose()
+
+@pytest.fixture
+def author(db):
+    author = User(email="alice@example.com", username="alice", password="x", post_count=0)
+    db.add(author)
+    db.commit()
+    return author
+
+def add_posts(db, author, count: int) -> list[int]:
+    posts = [Post(title=f"post {i}", author="alice", content="", author_id=author.id) for i in range(count)]
+    db.add_all(posts)
+    db.execute(update(User).where(User.id == author.id).values(post_count=count))
+    db.commit()
+    return [post.id for post in posts]
+
+def pages(service: PostService, author_id: int, limit: int, on_page=None) -> list[int]:
+    seen = []
+    cursor = None
+    while True:
+        page = service.get_user_posts(author_id, limit, cursor)
+        seen.extend(post.id for post in page["items"])
+        if page["next_cursor"] is None:
+            return seen
+        if on_page is not None:
+            on_page(page["items"][-1].id)
+        cursor = page["next_cursor"]
+
+def test_user_posts_newest_first(db, author):
+    ids = add_posts(db, author, 5)
+
+    assert pages(PostService(db), author.id, 2) == sorted(ids, reverse=True)
+
+@pytest.mark.parametrize("created_at", [
+    "2026-01-01 00:00:00",  # server_default(CURRENT_TIMESTAMP)로 저장된 형식 (소수점 없음)
+    "2026-01-01 00:00:00.123456",  # SQLAlchemy가 datetime을 저장하는 형식
+])
+def test_user_posts_cursor_post_deleted(db, author, created_at):
+    ids = add_posts(db, author, 6)
+    # 같은 시각에 작성된 게시글 사이에서도 ID 순서로 이어지는지 확인
+    db.execute(text("UPDATE posts SET created_at = :created_at"), {"created_at": created_at})
+    db.commit()
+
+    deleted = []
+    def delete_cursor_post(post_id: int):
+        db.execute(delete(Post).where(Post.id == post_id))
+        db.commit()
+        deleted.append(post_id)
+
+    seen = pages(PostService(db), author.id, 2, on_page=delete_cursor_post)
+
+    assert deleted
+    assert len(seen) == len(set(seen))
+    assert seen == sorted(ids, reverse=True)
+
+def test_invalid_cursor(db, author):
+    with pytest.raises(Exception) as e:
+        PostService(db).get_user_posts(author.id, 2, "not-a-cursor")
+    assert e.value.status_code == 400
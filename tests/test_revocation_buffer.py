@@ -0,0 +1,101 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.app.services.revocation_buffer import RevocationBuffer
+
+@pytest.fixture
+def buffer(tmp_path):
+    return RevocationBuffer(str(tmp_path))
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+def write_records(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+def test_replays_in_order_and_removes_file(buffer, tmp_path):
+    for jti in ("a", "b", "c"):
+        buffer.append({"jti": jti})
+    assert buffer.has_pending()
+
+    applied = []
+    assert buffer.replay(applied.append) == 3
+    assert [record["jti"] for record in applied] == ["a", "b", "c"]
+    assert os.listdir(tmp_path) == []
+    assert not buffer.has_pending()
+
+def test_failed_apply_keeps_remaining_records(buffer):
+    for jti in ("a", "b", "c"):
+        buffer.append({"jti": jti})
+
+    applied = []
+    def apply(record):
+        if record["jti"] == "b":
+            raise ConnectionError("down")
+        applied.append(record["jti"])
+
+    assert buffer.replay(apply) == 1
+    assert applied == ["a"]
+    assert buffer.has_pending()
+
+    assert buffer.replay(lambda record: applied.append(record["jti"])) == 2
+    assert applied == ["a", "b", "c"]
+    assert not buffer.has_pending()
+
+def test_claims_file_of_exited_worker(buffer, tmp_path):
+    write_records(tmp_path / f"revocations-{dead_pid()}.jsonl", [{"jti": "a"}])
+
+    applied = []
+    assert buffer.replay(applied.append) == 1
+    assert applied == [{"jti": "a"}]
+
+def test_claims_interrupted_replay_of_dead_process(buffer, tmp_path):
+    write_records(tmp_path / f"revocations-1.jsonl.replaying-{dead_pid()}", [{"jti": "a"}])
+    assert buffer.has_pending()
+
+    applied = []
+    assert buffer.replay(applied.append) == 1
+    assert applied == [{"jti": "a"}]
+    assert os.listdir(tmp_path) == []
+
+def test_skips_replay_in_progress_by_live_process(buffer, tmp_path):
+    # 살아 있는 프로세스(현재 프로세스)가 선점한 파일은 건드리지 않음
+    name = f"revocations-1.jsonl.replaying-{os.getpid()}"
+    write_records(tmp_path / name, [{"jti": "a"}])
+
+    assert not buffer.has_pending()
+    assert buffer.replay(lambda record: None) == 0
+    assert os.listdir(tmp_path) == [name]
+
+def test_missing_directory(tmp_path):
+    buffer = RevocationBuffer(str(tmp_path / "missing"))
+
+    assert not buffer.has_pending()
+    assert buffer.replay(lambda record: None) == 0
+
+def test_background_replay_waits_until_ready(buffer):
+    buffer.append({"jti": "a"})
+    ready = False
+    applied = []
+
+    buffer.start(applied.append, lambda: ready, interval=0.01)
+    try:
+        time.sleep(0.05)
+        assert applied == []
+
+        ready = True
+        deadline = time.monotonic() + 2.0
+        while not applied and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert applied == [{"jti": "a"}]
+    finally:
+        buffer.stop()
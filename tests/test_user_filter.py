@@ -0,0 +1,62 @@
+import pytest
+import redis
+
+from src.app.services import user_filter
+from src.app.services.user_filter import USER_FILTER_READY_KEY, BloomFilter
+
+@pytest.fixture
+def ready_filter(fake_redis, monkeypatch):
+    fake_redis.set(USER_FILTER_READY_KEY, "1")
+    monkeypatch.setattr(user_filter, "warm_in_background", lambda: None)
+    return fake_redis
+
+def test_bloom_filter_has_no_false_negatives(fake_redis):
+    bloom = BloomFilter("test:bloom", capacity=2000, error_rate=0.01)
+    added = [f"user{i}@example.com" for i in range(2000)]
+
+    pipe = fake_redis.pipeline(transaction=False)
+    for value in added:
+        bloom.add_to(pipe, value)
+    pipe.execute()
+
+    assert all(bloom.might_contain(value) for value in added)
+
+    # 오탐률은 설정값 근처 (1% 목표, 여유를 두고 3% 이하)
+    false_positives = sum(bloom.might_contain(f"other{i}@example.com") for i in range(2000))
+    assert false_positives <= 60
+
+def test_bloom_filter_sizing():
+    bloom = BloomFilter("test:bloom", capacity=1_000_000, error_rate=0.001)
+
+    # 최적 비트 수 약 14.4비트/원소, 해시 함수 약 10개
+    assert 14_000_000 < bloom.size < 14_500_000
+    assert bloom.hash_count == 10
+    offsets = bloom._offsets("alice")
+    assert len(set(offsets)) == bloom.hash_count
+    assert all(0 <= offset < bloom.size for offset in offsets)
+
+def test_might_exist_after_add_users(ready_filter):
+    user_filter.add_users([("alice@example.com", "alice")])
+
+    assert user_filter.might_exist("email", "alice@example.com") is True
+    assert user_filter.might_exist("username", "alice") is True
+    assert user_filter.might_exist("email", "bob@example.com") is False
+    assert user_filter.might_exist("username", "bob") is False
+
+def test_might_exist_falls_back_before_warm(fake_redis, monkeypatch):
+    warms = []
+    monkeypatch.setattr(user_filter, "warm_in_background", lambda: warms.append(1))
+
+    assert user_filter.might_exist("email", "alice@example.com") is None
+    assert warms == [1]
+
+def test_failed_add_invalidates_filter(ready_filter, monkeypatch):
+    def unavailable(pipe, value):
+        raise redis.exceptions.ConnectionError("down")
+
+    monkeypatch.setattr(user_filter.user_filters["email"], "add_to", unavailable)
+    user_filter.add_users([("alice@example.com", "alice")])
+
+    # 반영하지 못한 사용자를 "확실히 없음"으로 답하지 않도록 DB 확인으로 전환
+    assert not ready_filter.exists(USER_FILTER_READY_KEY)
+    assert user_filter.might_exist("email", "alice@example.com") is None